@@ -0,0 +1,28 @@
+"""Add balance_history (account_id, created_at) index
+
+Revision ID: 3f1c2a9d8b47
+Revises: 24ac67a15141
+Create Date: 2025-09-10 09:12:31.204815
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f1c2a9d8b47'
+down_revision = '24ac67a15141'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'idx_balance_history_account_created',
+        'balance_history',
+        ['account_id', 'created_at'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_balance_history_account_created', table_name='balance_history')
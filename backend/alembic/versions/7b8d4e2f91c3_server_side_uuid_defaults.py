@@ -0,0 +1,36 @@
+"""Generate ids server-side with gen_random_uuid()
+
+Revision ID: 7b8d4e2f91c3
+Revises: 3f1c2a9d8b47
+Create Date: 2025-09-10 10:02:17.640912
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7b8d4e2f91c3'
+down_revision = '3f1c2a9d8b47'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    for table in ('accounts', 'categories', 'balance_history'):
+        op.alter_column(
+            table, 'id',
+            server_default=sa.text('gen_random_uuid()'),
+            existing_type=sa.dialects.postgresql.UUID(as_uuid=True),
+            existing_nullable=False,
+        )
+
+
+def downgrade() -> None:
+    for table in ('accounts', 'categories', 'balance_history'):
+        op.alter_column(
+            table, 'id',
+            server_default=None,
+            existing_type=sa.dialects.postgresql.UUID(as_uuid=True),
+            existing_nullable=False,
+        )
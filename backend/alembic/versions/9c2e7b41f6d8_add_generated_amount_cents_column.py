@@ -0,0 +1,32 @@
+"""Add generated integer-cents column on transactions
+
+Revision ID: 9c2e7b41f6d8
+Revises: e6a4d27c9b15
+Create Date: 2025-09-10 15:52:36.208471
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9c2e7b41f6d8'
+down_revision = 'e6a4d27c9b15'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'transactions',
+        sa.Column(
+            'amount_cents',
+            sa.BigInteger(),
+            sa.Computed('(amount * 100)::bigint', persisted=True),
+            nullable=False,
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('transactions', 'amount_cents')
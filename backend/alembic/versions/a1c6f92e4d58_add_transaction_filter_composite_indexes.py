@@ -0,0 +1,39 @@
+"""Add composite indexes for transaction filter + date sort
+
+Revision ID: a1c6f92e4d58
+Revises: b4e8d15c7f29
+Create Date: 2025-09-10 12:05:38.902417
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a1c6f92e4d58'
+down_revision = 'b4e8d15c7f29'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY so existing deployments don't block writes while the
+    # indexes build (requires running outside a transaction)
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_transaction_category_date',
+            'transactions',
+            ['category_id', 'transaction_date'],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'idx_transaction_type_date',
+            'transactions',
+            ['type', 'transaction_date'],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_transaction_type_date', table_name='transactions')
+    op.drop_index('idx_transaction_category_date', table_name='transactions')
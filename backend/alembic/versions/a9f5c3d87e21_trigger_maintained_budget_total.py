@@ -0,0 +1,44 @@
+"""Maintain budgets.total_amount with a trigger
+
+Revision ID: a9f5c3d87e21
+Revises: 9c2e7b41f6d8
+Create Date: 2025-09-10 16:20:45.731908
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a9f5c3d87e21'
+down_revision = '9c2e7b41f6d8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE FUNCTION update_budget_total() RETURNS trigger AS $$
+        DECLARE
+            target uuid;
+        BEGIN
+            target := COALESCE(NEW.budget_id, OLD.budget_id);
+            UPDATE budgets SET total_amount = (
+                SELECT COALESCE(SUM(yearly_amount), 0)
+                FROM budget_line_items
+                WHERE budget_id = target
+            ) WHERE id = target;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER budget_line_items_total
+        AFTER INSERT OR UPDATE OR DELETE ON budget_line_items
+        FOR EACH ROW EXECUTE FUNCTION update_budget_total()
+    """)
+
+
+def downgrade() -> None:
+    op.execute('DROP TRIGGER budget_line_items_total ON budget_line_items')
+    op.execute('DROP FUNCTION update_budget_total()')
@@ -0,0 +1,117 @@
+"""Range-partition transactions by transaction_date
+
+Revision ID: b3d9e6f24a17
+Revises: a9f5c3d87e21
+Create Date: 2025-09-10 17:44:29.650312
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+_YEARS = range(2023, 2028)
+
+
+def _create_indexes():
+    op.create_index(
+        'idx_tx_account_date_cover',
+        'transactions',
+        ['account_id', 'transaction_date'],
+        postgresql_include=['amount', 'category_id', 'type', 'description'],
+    )
+    op.create_index('idx_transaction_category_date', 'transactions', ['category_id', 'transaction_date'])
+    op.create_index('idx_transaction_type_date', 'transactions', ['type', 'transaction_date'])
+    op.create_index('idx_transaction_date', 'transactions', ['transaction_date'])
+    op.create_index(
+        'idx_tx_description_trgm',
+        'transactions',
+        ['description'],
+        postgresql_using='gin',
+        postgresql_ops={'description': 'gin_trgm_ops'},
+    )
+
+
+# revision identifiers, used by Alembic.
+revision = 'b3d9e6f24a17'
+down_revision = 'a9f5c3d87e21'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE TABLE transactions_part (
+            id uuid NOT NULL,
+            account_id uuid NOT NULL REFERENCES accounts (id),
+            category_id uuid NOT NULL REFERENCES categories (id),
+            amount numeric(12, 2) NOT NULL,
+            amount_cents bigint GENERATED ALWAYS AS ((amount * 100)::bigint) STORED NOT NULL,
+            description varchar NOT NULL,
+            transaction_date date NOT NULL,
+            type varchar NOT NULL,
+            ai_category_id uuid REFERENCES categories (id),
+            ai_confidence double precision,
+            is_ai_categorized boolean NOT NULL,
+            user_corrected boolean NOT NULL,
+            created_at timestamp DEFAULT now(),
+            updated_at timestamp DEFAULT now(),
+            PRIMARY KEY (id, transaction_date)
+        ) PARTITION BY RANGE (transaction_date)
+    """)
+    for year in _YEARS:
+        op.execute(f"""
+            CREATE TABLE transactions_y{year} PARTITION OF transactions_part
+            FOR VALUES FROM ('{year}-01-01') TO ('{year + 1}-01-01')
+        """)
+    op.execute('CREATE TABLE transactions_default PARTITION OF transactions_part DEFAULT')
+
+    op.execute("""
+        INSERT INTO transactions_part (
+            id, account_id, category_id, amount, description,
+            transaction_date, type, ai_category_id, ai_confidence,
+            is_ai_categorized, user_corrected, created_at, updated_at
+        )
+        SELECT id, account_id, category_id, amount, description,
+               transaction_date, type, ai_category_id, ai_confidence,
+               is_ai_categorized, user_corrected, created_at, updated_at
+        FROM transactions
+    """)
+
+    op.execute('DROP TABLE transactions')
+    op.execute('ALTER TABLE transactions_part RENAME TO transactions')
+    _create_indexes()
+
+
+def downgrade() -> None:
+    op.execute("""
+        CREATE TABLE transactions_plain (
+            id uuid NOT NULL PRIMARY KEY,
+            account_id uuid NOT NULL REFERENCES accounts (id),
+            category_id uuid NOT NULL REFERENCES categories (id),
+            amount numeric(12, 2) NOT NULL,
+            amount_cents bigint GENERATED ALWAYS AS ((amount * 100)::bigint) STORED NOT NULL,
+            description varchar NOT NULL,
+            transaction_date date NOT NULL,
+            type varchar NOT NULL,
+            ai_category_id uuid REFERENCES categories (id),
+            ai_confidence double precision,
+            is_ai_categorized boolean NOT NULL,
+            user_corrected boolean NOT NULL,
+            created_at timestamp DEFAULT now(),
+            updated_at timestamp DEFAULT now()
+        )
+    """)
+    op.execute("""
+        INSERT INTO transactions_plain (
+            id, account_id, category_id, amount, description,
+            transaction_date, type, ai_category_id, ai_confidence,
+            is_ai_categorized, user_corrected, created_at, updated_at
+        )
+        SELECT id, account_id, category_id, amount, description,
+               transaction_date, type, ai_category_id, ai_confidence,
+               is_ai_categorized, user_corrected, created_at, updated_at
+        FROM transactions
+    """)
+    op.execute('DROP TABLE transactions')
+    op.execute('ALTER TABLE transactions_plain RENAME TO transactions')
+    _create_indexes()
@@ -0,0 +1,31 @@
+"""Add trigram index for transaction description search
+
+Revision ID: b4e8d15c7f29
+Revises: e9d2b6c14a85
+Create Date: 2025-09-10 11:41:52.118734
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b4e8d15c7f29'
+down_revision = 'e9d2b6c14a85'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index(
+        'idx_tx_description_trgm',
+        'transactions',
+        ['description'],
+        postgresql_using='gin',
+        postgresql_ops={'description': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_tx_description_trgm', table_name='transactions')
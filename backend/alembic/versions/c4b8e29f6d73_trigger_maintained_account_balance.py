@@ -0,0 +1,32 @@
+"""Maintain accounts.balance with a transaction trigger (withdrawn)
+
+Revision ID: c4b8e29f6d73
+Revises: b3d9e6f24a17
+Create Date: 2025-09-11 09:12:37.284516
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4b8e29f6d73'
+down_revision = 'b3d9e6f24a17'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Intentionally a no-op. Account balances are user-maintained via
+    # PUT /accounts (manual_update rows in balance_history); transaction
+    # writes have never touched accounts.balance, and the API posts
+    # expenses as negative amounts, so a type-signed trigger would move
+    # balances the wrong way. A bulk CSV import would also rewrite every
+    # balance and flood balance_history one row per transaction. Kept as
+    # an empty revision so databases that fetched this id stay on a
+    # single migration history.
+    pass
+
+
+def downgrade() -> None:
+    pass
@@ -0,0 +1,31 @@
+"""Replace bool index on accounts.is_active with a partial index
+
+Revision ID: c5a7f3e0d612
+Revises: 7b8d4e2f91c3
+Create Date: 2025-09-11 08:41:55.118237
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c5a7f3e0d612'
+down_revision = '7b8d4e2f91c3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_index('idx_account_active', table_name='accounts')
+    op.create_index(
+        'ix_accounts_active',
+        'accounts',
+        ['id'],
+        postgresql_where=sa.text('is_active = true'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_accounts_active', table_name='accounts')
+    op.create_index('idx_account_active', 'accounts', ['is_active'])
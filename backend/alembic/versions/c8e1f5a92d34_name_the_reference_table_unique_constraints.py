@@ -0,0 +1,28 @@
+"""Name the reference-table unique constraints
+
+Revision ID: c8e1f5a92d34
+Revises: f2b9c64a7e13
+Create Date: 2025-09-10 14:31:22.874059
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c8e1f5a92d34'
+down_revision = 'f2b9c64a7e13'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The unique=True column flag produced auto-named constraints; give
+    # them stable names that ON CONFLICT (constraint=...) can target
+    op.execute('ALTER TABLE account_types RENAME CONSTRAINT account_types_name_key TO uq_account_types_name')
+    op.execute('ALTER TABLE categories RENAME CONSTRAINT categories_name_key TO uq_categories_name')
+
+
+def downgrade() -> None:
+    op.execute('ALTER TABLE categories RENAME CONSTRAINT uq_categories_name TO categories_name_key')
+    op.execute('ALTER TABLE account_types RENAME CONSTRAINT uq_account_types_name TO account_types_name_key')
@@ -0,0 +1,37 @@
+"""Promote account+date index to a covering index
+
+Revision ID: d7f3a85b2c91
+Revises: a1c6f92e4d58
+Create Date: 2025-09-10 13:27:04.561289
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd7f3a85b2c91'
+down_revision = 'a1c6f92e4d58'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_tx_account_date_cover',
+            'transactions',
+            ['account_id', 'transaction_date'],
+            postgresql_include=['amount', 'category_id', 'type', 'description'],
+            postgresql_concurrently=True,
+        )
+    op.drop_index('idx_transaction_account_date', table_name='transactions')
+
+
+def downgrade() -> None:
+    op.create_index(
+        'idx_transaction_account_date',
+        'transactions',
+        ['account_id', 'transaction_date'],
+    )
+    op.drop_index('idx_tx_account_date_cover', table_name='transactions')
@@ -0,0 +1,26 @@
+"""Drop single-column transaction indexes subsumed by composites
+
+Revision ID: e6a4d27c9b15
+Revises: c8e1f5a92d34
+Create Date: 2025-09-10 15:08:11.467923
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e6a4d27c9b15'
+down_revision = 'c8e1f5a92d34'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_index('idx_transaction_category', table_name='transactions')
+    op.drop_index('idx_transaction_type', table_name='transactions')
+
+
+def downgrade() -> None:
+    op.create_index('idx_transaction_type', 'transactions', ['type'])
+    op.create_index('idx_transaction_category', 'transactions', ['category_id'])
@@ -0,0 +1,40 @@
+"""Make budget_line_items.monthly_amount a generated column
+
+Revision ID: e7d2f48a1c96
+Revises: c4b8e29f6d73
+Create Date: 2025-09-11 10:48:15.402973
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e7d2f48a1c96'
+down_revision = 'c4b8e29f6d73'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Postgres can't convert an existing column to GENERATED in place
+    op.drop_column('budget_line_items', 'monthly_amount')
+    op.add_column(
+        'budget_line_items',
+        sa.Column(
+            'monthly_amount',
+            sa.Numeric(12, 2),
+            sa.Computed('round(yearly_amount / 12.0, 2)', persisted=True),
+            nullable=False,
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('budget_line_items', 'monthly_amount')
+    op.add_column(
+        'budget_line_items',
+        sa.Column('monthly_amount', sa.Numeric(12, 2), nullable=True),
+    )
+    op.execute('UPDATE budget_line_items SET monthly_amount = round(yearly_amount / 12.0, 2)')
+    op.alter_column('budget_line_items', 'monthly_amount', nullable=False)
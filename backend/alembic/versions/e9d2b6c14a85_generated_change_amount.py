@@ -0,0 +1,36 @@
+"""Make balance_history.change_amount a stored generated column
+
+Revision ID: e9d2b6c14a85
+Revises: c5a7f3e0d612
+Create Date: 2025-09-11 14:27:09.552481
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e9d2b6c14a85'
+down_revision = 'c5a7f3e0d612'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # PostgreSQL cannot convert an existing column to GENERATED in place
+    op.drop_column('balance_history', 'change_amount')
+    op.add_column(
+        'balance_history',
+        sa.Column(
+            'change_amount',
+            sa.Numeric(12, 2),
+            sa.Computed('new_balance - previous_balance', persisted=True),
+            nullable=False,
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('balance_history', 'change_amount')
+    op.add_column('balance_history', sa.Column('change_amount', sa.Numeric(12, 2), nullable=False))
+    op.execute('UPDATE balance_history SET change_amount = new_balance - previous_balance')
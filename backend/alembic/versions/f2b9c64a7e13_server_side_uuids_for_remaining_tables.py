@@ -0,0 +1,36 @@
+"""Server-side id generation for account_types and budget tables
+
+Revision ID: f2b9c64a7e13
+Revises: d7f3a85b2c91
+Create Date: 2025-09-10 14:02:48.335176
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f2b9c64a7e13'
+down_revision = 'd7f3a85b2c91'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    for table in ('account_types', 'budgets', 'budget_line_items'):
+        op.alter_column(
+            table, 'id',
+            server_default=sa.text('gen_random_uuid()'),
+            existing_type=sa.dialects.postgresql.UUID(as_uuid=True),
+            existing_nullable=False,
+        )
+
+
+def downgrade() -> None:
+    for table in ('account_types', 'budgets', 'budget_line_items'):
+        op.alter_column(
+            table, 'id',
+            server_default=None,
+            existing_type=sa.dialects.postgresql.UUID(as_uuid=True),
+            existing_nullable=False,
+        )
@@ -0,0 +1,38 @@
+"""Covering index for the budget summary aggregates
+
+Revision ID: f9a3c71e5b28
+Revises: e7d2f48a1c96
+Create Date: 2025-09-11 11:21:52.817634
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f9a3c71e5b28'
+down_revision = 'e7d2f48a1c96'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY isn't supported on partitioned parents, so this is a
+    # plain create; per-partition builds keep the locks short
+    op.create_index(
+        'idx_tx_type_date_cat',
+        'transactions',
+        ['type', 'transaction_date', 'category_id'],
+        postgresql_include=['amount'],
+    )
+    # Redundant prefix of the new index
+    op.drop_index('idx_transaction_type_date', table_name='transactions')
+
+
+def downgrade() -> None:
+    op.create_index(
+        'idx_transaction_type_date',
+        'transactions',
+        ['type', 'transaction_date'],
+    )
+    op.drop_index('idx_tx_type_date_cat', table_name='transactions')
@@ -0,0 +1,39 @@
+from app.models import Transaction as TransactionModel
+
+def apply_transaction_filters(
+    stmt,
+    *,
+    account_id=None,
+    category_id=None,
+    start_date=None,
+    end_date=None,
+    transaction_type=None,
+    min_amount=None,
+    max_amount=None,
+    search=None,
+):
+    """Append transaction filter clauses for each non-None param.
+
+    Shared by the transaction list and summary endpoints so both compile
+    the same Core expressions; repeated statement shapes then hit
+    SQLAlchemy's compiled-statement cache instead of recompiling.
+    """
+    if account_id:
+        stmt = stmt.where(TransactionModel.account_id == account_id)
+    if category_id:
+        stmt = stmt.where(TransactionModel.category_id == category_id)
+    if start_date:
+        stmt = stmt.where(TransactionModel.transaction_date >= start_date)
+    if end_date:
+        stmt = stmt.where(TransactionModel.transaction_date <= end_date)
+    if transaction_type:
+        stmt = stmt.where(TransactionModel.type == transaction_type)
+    if min_amount is not None:
+        stmt = stmt.where(TransactionModel.amount >= min_amount)
+    if max_amount is not None:
+        stmt = stmt.where(TransactionModel.amount <= max_amount)
+    if search:
+        # ILIKE so Postgres can use the trigram GIN index on description;
+        # lower(...) LIKE forced a sequential scan
+        stmt = stmt.where(TransactionModel.description.ilike(f"%{search}%"))
+    return stmt
@@ -1,14 +1,51 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from typing import List
+import time
+from collections import OrderedDict
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy import select
+import orjson
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
 from app.models import AccountType as AccountTypeModel
-from app.schemas import AccountType
 
 router = APIRouter()
 
-@router.get("/", response_model=List[AccountType])
-def get_account_types(db: Session = Depends(get_db)):
-    """Get all account types"""
-    return db.query(AccountTypeModel).all()
\ No newline at end of file
+# Account types are seed data with no write endpoints; a short TTL
+# response cache makes repeat reads ~free
+_LIST_CACHE_TTL = 30.0
+_LIST_CACHE_MAX = 128
+_list_cache: OrderedDict = OrderedDict()  # (skip, limit) -> (cached_at, encoded body)
+_CACHE_CONTROL = "max-age=30, stale-while-revalidate=60"
+
+@router.get("/")
+async def get_account_types(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=500),
+    db: AsyncSession = Depends(get_db)
+):
+    """Get account types with pagination"""
+    cache_key = (skip, limit)
+    cached = _list_cache.get(cache_key)
+    if cached and time.monotonic() - cached[0] < _LIST_CACHE_TTL:
+        # Hits move to the back so eviction drops the least recently used
+        _list_cache.move_to_end(cache_key)
+        body = cached[1]
+    else:
+        rows = (await db.execute(
+            select(
+                AccountTypeModel.id, AccountTypeModel.name,
+                AccountTypeModel.category, AccountTypeModel.sub_category,
+                AccountTypeModel.created_at, AccountTypeModel.updated_at
+            ).offset(skip).limit(limit)
+        )).mappings().all()
+        body = orjson.dumps([dict(r) for r in rows])
+        # Bounded: skip/limit are client-controlled, so the key space is
+        # unbounded without a cap
+        if len(_list_cache) >= _LIST_CACHE_MAX:
+            _list_cache.popitem(last=False)
+        _list_cache[cache_key] = (time.monotonic(), body)
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"Cache-Control": _CACHE_CONTROL},
+    )
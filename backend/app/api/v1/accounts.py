@@ -1,270 +1,354 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse, StreamingResponse
+import orjson
+import time
 import uuid
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import select, text, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from typing import List
-from decimal import Decimal, InvalidOperation
 
-from app.core.database import get_db
-from app.models import Account as AccountModel, BalanceHistory as BalanceHistoryModel
+from app.core.database import get_db, AsyncSessionLocal
+from app.models import Account as AccountModel, AccountType as AccountTypeModel, BalanceHistory as BalanceHistoryModel
 from app.schemas import Account, AccountCreate, AccountUpdate, BalanceHistory, BalanceHistoryCreate
+# Cached transaction list bodies embed account rows, so account edits
+# must drop them too
+from .transactions import _invalidate_read_cache as _invalidate_transaction_cache
 
 router = APIRouter()
 
-def validate_account_data(data: AccountCreate | AccountUpdate) -> List[str]:
-    """Validate account data and return list of error messages"""
-    errors = []
-    
-    # Name validation
-    if hasattr(data, 'name') and data.name is not None:
-        if not data.name.strip():
-            errors.append("Account name is required")
-        elif len(data.name.strip()) < 2:
-            errors.append("Account name must be at least 2 characters")
-        elif len(data.name.strip()) > 100:
-            errors.append("Account name must be less than 100 characters")
-    
-    # Balance validation
-    if hasattr(data, 'balance') and data.balance is not None:
-        try:
-            balance = Decimal(str(data.balance))
-            if balance < Decimal('-999999999.99') or balance > Decimal('999999999.99'):
-                errors.append("Balance must be between -999,999,999.99 and 999,999,999.99")
-        except (InvalidOperation, ValueError):
-            errors.append("Balance must be a valid number")
-    
-    # Institution validation
-    if hasattr(data, 'institution') and data.institution is not None:
-        if len(data.institution.strip()) > 100:
-            errors.append("Institution name must be less than 100 characters")
-    
-    # Account number validation
-    if hasattr(data, 'account_number') and data.account_number is not None:
-        if data.account_number.strip() and not data.account_number.strip().isdigit():
-            errors.append("Account number must contain only digits")
-        elif len(data.account_number.strip()) > 4:
-            errors.append("Account number must be 4 digits or less")
-    
-    return errors
-
-@router.get("/", response_model=List[Account])
-def get_accounts(db: Session = Depends(get_db), include_inactive: bool = False):
-    """Get all accounts (active by default)"""
-    query = db.query(AccountModel)
+# Valid account-type ids change rarely, so cache them in-process for a
+# short TTL instead of issuing a SELECT on every create/update. The FK
+# constraint remains the source of truth at INSERT time.
+_ACCOUNT_TYPE_CACHE_TTL = 60.0
+_account_type_cache: tuple[float, frozenset] = (0.0, frozenset())
+
+async def _valid_account_type_ids(db, refresh: bool = False) -> frozenset:
+    """Return the cached set of account-type ids, reloading when stale"""
+    global _account_type_cache
+    cached_at, ids = _account_type_cache
+    now = time.monotonic()
+    if refresh or now - cached_at >= _ACCOUNT_TYPE_CACHE_TTL:
+        ids = frozenset((await db.scalars(select(AccountTypeModel.id))).all())
+        _account_type_cache = (now, ids)
+    return ids
+
+async def _check_account_type_exists(db, account_type_id) -> bool:
+    """Check an account-type id against the cache, re-reading on a miss
+    so a freshly created type is never rejected"""
+    ids = await _valid_account_type_ids(db)
+    if account_type_id not in ids:
+        ids = await _valid_account_type_ids(db, refresh=True)
+    return account_type_id in ids
+
+@router.get("/")
+async def get_accounts(
+    include_inactive: bool = False,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=500),
+    db: AsyncSession = Depends(get_db)
+):
+    """Get accounts (active by default) with pagination"""
+    # Plain column select + orjson: the rows are already typed coming out
+    # of the DB, so skip ORM hydration and Pydantic re-validation entirely
+    stmt = (
+        select(
+            AccountModel.id, AccountModel.name, AccountModel.account_type_id,
+            AccountModel.balance, AccountModel.institution, AccountModel.account_number,
+            AccountModel.currency, AccountModel.is_active,
+            AccountModel.created_at, AccountModel.updated_at,
+            AccountTypeModel.name.label("type_name"),
+            AccountTypeModel.category.label("type_category"),
+            AccountTypeModel.sub_category.label("type_sub_category"),
+            AccountTypeModel.created_at.label("type_created_at"),
+            AccountTypeModel.updated_at.label("type_updated_at"),
+        )
+        .join(AccountTypeModel, AccountModel.account_type_id == AccountTypeModel.id)
+    )
     if not include_inactive:
-        query = query.filter(AccountModel.is_active == True)
-    return query.all()
+        stmt = stmt.where(AccountModel.is_active == True)
+    rows = (await db.execute(stmt.offset(skip).limit(limit))).mappings().all()
+    return ORJSONResponse([
+        {
+            "id": r["id"],
+            "name": r["name"],
+            "account_type_id": r["account_type_id"],
+            # Decimal-as-string, matching the response-model endpoints
+            # and the frontend's balance: string contract
+            "balance": str(r["balance"]),
+            "institution": r["institution"],
+            "account_number": r["account_number"],
+            "currency": r["currency"],
+            "is_active": r["is_active"],
+            "created_at": r["created_at"],
+            "updated_at": r["updated_at"],
+            "account_type": {
+                "id": r["account_type_id"],
+                "name": r["type_name"],
+                "category": r["type_category"],
+                "sub_category": r["type_sub_category"],
+                "created_at": r["type_created_at"],
+                "updated_at": r["type_updated_at"],
+            },
+        }
+        for r in rows
+    ])
 
 @router.get("/{account_id}", response_model=Account)
-def get_account(account_id: str, db: Session = Depends(get_db)):
+async def get_account(account_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
     """Get a specific account"""
-    account = db.query(AccountModel).filter(AccountModel.id == account_id).first()
+    account = await db.get(
+        AccountModel, account_id,
+        options=[selectinload(AccountModel.account_type)]
+    )
     if not account:
         raise HTTPException(status_code=404, detail="Account not found")
     return account
 
 @router.post("/", response_model=Account, status_code=201)
-def create_account(account: AccountCreate, db: Session = Depends(get_db)):
+async def create_account(account: AccountCreate, db: AsyncSession = Depends(get_db)):
     """Create a new account"""
-    # Validate input data
-    validation_errors = validate_account_data(account)
-    if validation_errors:
-        raise HTTPException(
-            status_code=422, 
-            detail={
-                "message": "Validation failed",
-                "errors": validation_errors
-            }
-        )
-    
+    # Field-level validation happens in the AccountCreate schema
+
     # Check if account type exists
     if account.account_type_id:
-        from app.models import AccountType as AccountTypeModel
-        account_type = db.query(AccountTypeModel).filter(
-            AccountTypeModel.id == account.account_type_id
-        ).first()
-        if not account_type:
+        if not await _check_account_type_exists(db, account.account_type_id):
             raise HTTPException(
                 status_code=400,
                 detail="Invalid account type ID"
             )
-    
+
     try:
-        account_data = account.dict()
-        account_data["id"] = str(uuid.uuid4())
-        
-        db_account = AccountModel(**account_data)
-        db.add(db_account)
-        db.commit()
-        db.refresh(db_account)
-        return db_account
-    
+        # Core insert with RETURNING skips unit-of-work bookkeeping for
+        # the single-row hot path
+        result = await db.execute(
+            insert(AccountModel).values(**account.model_dump()).returning(AccountModel)
+        )
+        db_account = result.scalar_one()
+        await db.commit()
+        # Reload with account_type for response serialization
+        return await db.scalar(
+            select(AccountModel)
+            .options(selectinload(AccountModel.account_type))
+            .where(AccountModel.id == db_account.id)
+        )
+
     except IntegrityError as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=400,
             detail="Account creation failed due to data integrity constraints"
         )
     except SQLAlchemyError as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=500,
             detail="Database error occurred while creating account"
         )
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=500,
             detail="An unexpected error occurred while creating the account"
         )
 
 @router.put("/{account_id}", response_model=Account)
-def update_account(
-    account_id: str, 
-    account_update: AccountUpdate, 
-    db: Session = Depends(get_db)
+async def update_account(
+    account_id: uuid.UUID,
+    account_update: AccountUpdate,
+    db: AsyncSession = Depends(get_db)
 ):
     """Update an account"""
-    account = db.query(AccountModel).filter(AccountModel.id == account_id).first()
+    account = await db.get(AccountModel, account_id)
     if not account:
         raise HTTPException(status_code=404, detail="Account not found")
-    
-    # Validate input data
-    validation_errors = validate_account_data(account_update)
-    if validation_errors:
-        raise HTTPException(
-            status_code=422,
-            detail={
-                "message": "Validation failed",
-                "errors": validation_errors
-            }
-        )
-    
+
     # Check if account type exists (if being updated)
     if hasattr(account_update, 'account_type_id') and account_update.account_type_id:
-        from app.models import AccountType as AccountTypeModel
-        account_type = db.query(AccountTypeModel).filter(
-            AccountTypeModel.id == account_update.account_type_id
-        ).first()
-        if not account_type:
+        if not await _check_account_type_exists(db, account_update.account_type_id):
             raise HTTPException(
                 status_code=400,
                 detail="Invalid account type ID"
             )
-    
+
     try:
-        update_data = account_update.dict(exclude_unset=True)
-        
-        # Track balance changes for history
-        old_balance = account.balance
-        
-        for field, value in update_data.items():
-            setattr(account, field, value)
-        
-        # Create balance history record if balance changed (skip if table doesn't exist)
-        if 'balance' in update_data and account.balance != old_balance:
-            try:
-                change_amount = account.balance - old_balance
-                balance_history = BalanceHistoryModel(
-                    id=str(uuid.uuid4()),
-                    account_id=account_id,
-                    previous_balance=old_balance,
-                    new_balance=account.balance,
-                    change_amount=change_amount,
-                    change_reason="manual_update",
-                    notes="Balance updated via API"
-                )
-                db.add(balance_history)
-            except SQLAlchemyError:
-                # Skip balance history if table doesn't exist yet
-                pass
-        
-        db.commit()
-        db.refresh(account)
-        return account
-        
+        # Apply only the fields the client actually sent, without building
+        # an intermediate dict
+        updated_fields = account_update.model_fields_set
+
+        # Balance changes fold the UPDATE and the history INSERT into one
+        # CTE statement so a balance edit costs a single round-trip
+        if 'balance' in updated_fields and account_update.balance != account.balance:
+            await db.execute(
+                text("""
+                    WITH upd AS (
+                        UPDATE accounts
+                        -- updated_at normally bumps via the ORM onupdate,
+                        -- which this raw UPDATE bypasses
+                        SET balance = :new_balance, updated_at = now()
+                        WHERE id = :account_id
+                        RETURNING id, balance
+                    )
+                    INSERT INTO balance_history
+                        (account_id, previous_balance, new_balance,
+                         change_reason, notes)
+                    SELECT id, :old_balance, balance,
+                           'manual_update', 'Balance updated via API'
+                    FROM upd
+                """),
+                {
+                    "account_id": account_id,
+                    "new_balance": account_update.balance,
+                    "old_balance": account.balance,
+                },
+            )
+            # Let the response reload pick up the new value without
+            # emitting a second UPDATE on flush
+            db.expire(account, ['balance', 'updated_at'])
+            updated_fields = updated_fields - {'balance'}
+
+        for field in updated_fields:
+            setattr(account, field, getattr(account_update, field))
+
+        await db.commit()
+        _invalidate_transaction_cache()
+        # Reload with account_type for response serialization
+        return await db.scalar(
+            select(AccountModel)
+            .options(selectinload(AccountModel.account_type))
+            .where(AccountModel.id == account.id)
+        )
+
     except IntegrityError as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=400,
             detail="Account update failed due to data integrity constraints"
         )
     except SQLAlchemyError as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=500,
             detail="Database error occurred while updating account"
         )
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=500,
             detail="An unexpected error occurred while updating the account"
         )
 
 @router.delete("/{account_id}")
-def delete_account(account_id: str, db: Session = Depends(get_db)):
+async def delete_account(account_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
     """Deactivate an account (soft delete)"""
-    account = db.query(AccountModel).filter(AccountModel.id == account_id).first()
+    account = await db.get(AccountModel, account_id)
     if not account:
         raise HTTPException(status_code=404, detail="Account not found")
-    
+
     if not account.is_active:
         raise HTTPException(status_code=400, detail="Account is already deactivated")
-    
+
     try:
         account.is_active = False
-        db.commit()
+        await db.commit()
+        _invalidate_transaction_cache()
         return {"message": "Account deactivated successfully"}
     except SQLAlchemyError as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=500,
             detail="Database error occurred while deactivating account"
         )
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=500,
             detail="An unexpected error occurred while deactivating the account"
         )
 
 @router.post("/{account_id}/reactivate")
-def reactivate_account(account_id: str, db: Session = Depends(get_db)):
+async def reactivate_account(account_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
     """Reactivate a deactivated account"""
-    account = db.query(AccountModel).filter(AccountModel.id == account_id).first()
+    account = await db.get(AccountModel, account_id)
     if not account:
         raise HTTPException(status_code=404, detail="Account not found")
-    
+
     if account.is_active:
         raise HTTPException(status_code=400, detail="Account is already active")
-    
+
     try:
         account.is_active = True
-        db.commit()
+        await db.commit()
+        _invalidate_transaction_cache()
         return {"message": "Account reactivated successfully"}
     except SQLAlchemyError as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=500,
             detail="Database error occurred while reactivating account"
         )
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=500,
             detail="An unexpected error occurred while reactivating the account"
         )
 
 @router.get("/{account_id}/balance-history", response_model=List[BalanceHistory])
-def get_account_balance_history(account_id: str, db: Session = Depends(get_db)):
-    """Get balance history for a specific account"""
-    account = db.query(AccountModel).filter(AccountModel.id == account_id).first()
+async def get_account_balance_history(
+    account_id: uuid.UUID,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=500),
+    db: AsyncSession = Depends(get_db)
+):
+    """Get balance history for a specific account with pagination"""
+    account = await db.get(AccountModel, account_id)
     if not account:
         raise HTTPException(status_code=404, detail="Account not found")
-    
-    balance_history = db.query(BalanceHistoryModel).filter(
-        BalanceHistoryModel.account_id == account_id
-    ).order_by(BalanceHistoryModel.created_at.desc()).all()
-    
+
+    balance_history = (await db.scalars(
+        select(BalanceHistoryModel)
+        .where(BalanceHistoryModel.account_id == account_id)
+        .order_by(BalanceHistoryModel.created_at.desc())
+        .offset(skip).limit(limit)
+    )).all()
+
     return balance_history
+
+@router.get("/{account_id}/balance-history.ndjson")
+async def stream_account_balance_history(account_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
+    """Stream an account's full balance history as NDJSON.
+
+    Rows are fetched with a server-side cursor and written one line at a
+    time, so memory stays constant no matter how long the history is.
+    """
+    account = await db.get(AccountModel, account_id)
+    if not account:
+        raise HTTPException(status_code=404, detail="Account not found")
+
+    stmt = (
+        select(
+            BalanceHistoryModel.id, BalanceHistoryModel.account_id,
+            BalanceHistoryModel.previous_balance, BalanceHistoryModel.new_balance,
+            BalanceHistoryModel.change_amount, BalanceHistoryModel.change_reason,
+            BalanceHistoryModel.notes, BalanceHistoryModel.created_at,
+        )
+        .where(BalanceHistoryModel.account_id == account_id)
+        .order_by(BalanceHistoryModel.created_at.desc())
+        .execution_options(yield_per=1000)
+    )
+
+    async def generate():
+        # The request-scoped session is torn down before the body is
+        # streamed, so the generator owns its own session
+        async with AsyncSessionLocal() as session:
+            result = await session.stream(stmt)
+            async for r in result.mappings():
+                row = dict(r)
+                row["previous_balance"] = float(row["previous_balance"])
+                row["new_balance"] = float(row["new_balance"])
+                row["change_amount"] = float(row["change_amount"])
+                yield orjson.dumps(row) + b"\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
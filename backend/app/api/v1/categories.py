@@ -1,65 +1,113 @@
+import time
+from collections import OrderedDict
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+import orjson
 import uuid
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import List
+from sqlalchemy import select, insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
 from app.models import Category as CategoryModel
 from app.schemas import Category, CategoryCreate, CategoryUpdate
+# Cached transaction list bodies embed category rows, so category edits
+# must drop them too
+from .transactions import _invalidate_read_cache as _invalidate_transaction_cache
 
 router = APIRouter()
 
-@router.get("/", response_model=List[Category])
-def get_categories(db: Session = Depends(get_db)):
-    """Get all categories"""
-    return db.query(CategoryModel).all()
+# Categories are near-static reference data; cache the encoded list
+# response briefly and invalidate on any write through this router
+_LIST_CACHE_TTL = 30.0
+_LIST_CACHE_MAX = 128
+_list_cache: OrderedDict = OrderedDict()  # (skip, limit) -> (cached_at, encoded body)
+_CACHE_CONTROL = "max-age=30, stale-while-revalidate=60"
+
+def _invalidate_list_cache():
+    _list_cache.clear()
+
+@router.get("/")
+async def get_categories(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=500),
+    db: AsyncSession = Depends(get_db)
+):
+    """Get categories with pagination"""
+    cache_key = (skip, limit)
+    cached = _list_cache.get(cache_key)
+    if cached and time.monotonic() - cached[0] < _LIST_CACHE_TTL:
+        # Hits move to the back so eviction drops the least recently used
+        _list_cache.move_to_end(cache_key)
+        body = cached[1]
+    else:
+        # Plain column select + orjson: skip ORM hydration and Pydantic
+        # re-validation on the way out
+        rows = (await db.execute(
+            select(
+                CategoryModel.id, CategoryModel.name, CategoryModel.type,
+                CategoryModel.color, CategoryModel.created_at, CategoryModel.updated_at
+            ).offset(skip).limit(limit)
+        )).mappings().all()
+        body = orjson.dumps([dict(r) for r in rows])
+        # Bounded: skip/limit are client-controlled, so the key space is
+        # unbounded without a cap
+        if len(_list_cache) >= _LIST_CACHE_MAX:
+            _list_cache.popitem(last=False)
+        _list_cache[cache_key] = (time.monotonic(), body)
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"Cache-Control": _CACHE_CONTROL},
+    )
 
 @router.get("/{category_id}", response_model=Category)
-def get_category(category_id: str, db: Session = Depends(get_db)):
+async def get_category(category_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
     """Get a specific category"""
-    category = db.query(CategoryModel).filter(CategoryModel.id == category_id).first()
+    category = await db.get(CategoryModel, category_id)
     if not category:
         raise HTTPException(status_code=404, detail="Category not found")
     return category
 
 @router.post("/", response_model=Category, status_code=201)
-def create_category(category: CategoryCreate, db: Session = Depends(get_db)):
+async def create_category(category: CategoryCreate, db: AsyncSession = Depends(get_db)):
     """Create a new category"""
-    category_data = category.dict()
-    category_data["id"] = str(uuid.uuid4())
-    
-    db_category = CategoryModel(**category_data)
-    db.add(db_category)
-    db.commit()
-    db.refresh(db_category)
+    # Core insert with RETURNING skips unit-of-work bookkeeping and the
+    # post-commit refresh round-trip
+    db_category = (await db.execute(
+        insert(CategoryModel).values(**category.model_dump()).returning(CategoryModel)
+    )).scalar_one()
+    await db.commit()
+    _invalidate_list_cache()
     return db_category
 
 @router.put("/{category_id}", response_model=Category)
-def update_category(
-    category_id: str, 
-    category_update: CategoryUpdate, 
-    db: Session = Depends(get_db)
+async def update_category(
+    category_id: uuid.UUID,
+    category_update: CategoryUpdate,
+    db: AsyncSession = Depends(get_db)
 ):
     """Update a category"""
-    category = db.query(CategoryModel).filter(CategoryModel.id == category_id).first()
+    category = await db.get(CategoryModel, category_id)
     if not category:
         raise HTTPException(status_code=404, detail="Category not found")
-    
-    update_data = category_update.dict(exclude_unset=True)
+
+    update_data = category_update.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(category, field, value)
-    
-    db.commit()
-    db.refresh(category)
+
+    await db.commit()
+    _invalidate_list_cache()
+    _invalidate_transaction_cache()
     return category
 
 @router.delete("/{category_id}")
-def delete_category(category_id: str, db: Session = Depends(get_db)):
+async def delete_category(category_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
     """Delete a category"""
-    category = db.query(CategoryModel).filter(CategoryModel.id == category_id).first()
+    category = await db.get(CategoryModel, category_id)
     if not category:
         raise HTTPException(status_code=404, detail="Category not found")
-    
-    db.delete(category)
-    db.commit()
-    return {"message": "Category deleted successfully"}
\ No newline at end of file
+
+    await db.delete(category)
+    await db.commit()
+    _invalidate_list_cache()
+    _invalidate_transaction_cache()
+    return {"message": "Category deleted successfully"}
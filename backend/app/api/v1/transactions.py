@@ -1,24 +1,75 @@
+import anyio.to_thread
+import base64
+from collections import OrderedDict
+from pathlib import Path
+import time
 import uuid
 import io
+import orjson
 import pandas as pd
-from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, File
-from fastapi.responses import FileResponse
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, func
-from typing import List, Optional
+from uuid6 import uuid7
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, UploadFile, File
+from fastapi.responses import FileResponse, ORJSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy import and_, or_, func, select, case
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload, raiseload
+from typing import Optional
 from datetime import date, datetime
 from decimal import Decimal, InvalidOperation
 
 from app.core.database import get_db
-from app.models import Transaction as TransactionModel, Account as AccountModel, Category as CategoryModel
+from app.models import Transaction as TransactionModel, Account as AccountModel, AccountType as AccountTypeModel, Category as CategoryModel
 from app.schemas import Transaction, TransactionCreate, TransactionUpdate
+from ._filters import apply_transaction_filters
 
 router = APIRouter()
 
-@router.get("/", response_model=List[Transaction])
-def get_transactions(
-    account_id: Optional[str] = Query(None),
-    category_id: Optional[str] = Query(None),
+# Short-lived response cache for the read endpoints: dashboards re-issue
+# identical list/summary queries on every refresh. Entries hold the
+# serialized body and are dropped on any transaction write; the account
+# and category routers also invalidate, since list bodies embed their
+# rows and a rename or balance edit must not serve stale for the TTL.
+_TEMPLATE_PATH = Path(__file__).resolve().parents[2] / 'templates' / 'transaction_import_template.csv'
+
+_READ_CACHE_TTL = 60.0
+_READ_CACHE_MAX = 512
+_read_cache: OrderedDict = OrderedDict()  # (endpoint, params...) -> (cached_at, encoded body)
+
+# Validate/serialize single-row responses in one TypeAdapter pass
+# instead of FastAPI's response_model validation + jsonable_encoder
+_transaction_adapter = TypeAdapter(Transaction)
+
+def _transaction_response(transaction, status_code=200):
+    return ORJSONResponse(
+        _transaction_adapter.dump_python(
+            _transaction_adapter.validate_python(transaction, from_attributes=True),
+            mode="json",
+        ),
+        status_code=status_code,
+    )
+
+
+def _read_cache_get(key):
+    cached = _read_cache.get(key)
+    if cached and time.monotonic() - cached[0] < _READ_CACHE_TTL:
+        # Hits move to the back so eviction drops the least recently used
+        _read_cache.move_to_end(key)
+        return cached[1]
+    return None
+
+def _read_cache_put(key, body):
+    if len(_read_cache) >= _READ_CACHE_MAX:
+        _read_cache.popitem(last=False)
+    _read_cache[key] = (time.monotonic(), body)
+
+def _invalidate_read_cache():
+    _read_cache.clear()
+
+@router.get("/")
+async def get_transactions(
+    account_id: Optional[uuid.UUID] = Query(None),
+    category_id: Optional[uuid.UUID] = Query(None),
     start_date: Optional[date] = Query(None),
     end_date: Optional[date] = Query(None),
     transaction_type: Optional[str] = Query(None),
@@ -29,102 +80,239 @@ def get_transactions(
     sort_order: Optional[str] = Query("desc"),
     limit: Optional[int] = Query(100),
     offset: Optional[int] = Query(0),
-    db: Session = Depends(get_db)
+    after: Optional[str] = Query(None, description="Keyset cursor from a previous page's next_cursor"),
+    request: Request = None,
+    db: AsyncSession = Depends(get_db)
 ):
     """Get transactions with advanced filtering, searching, sorting and pagination"""
-    query = db.query(TransactionModel)
-    
-    # Apply filters
-    if account_id:
-        query = query.filter(TransactionModel.account_id == account_id)
-    if category_id:
-        query = query.filter(TransactionModel.category_id == category_id)
-    if start_date:
-        query = query.filter(TransactionModel.transaction_date >= start_date)
-    if end_date:
-        query = query.filter(TransactionModel.transaction_date <= end_date)
-    if transaction_type:
-        query = query.filter(TransactionModel.type == transaction_type)
-    if min_amount is not None:
-        query = query.filter(TransactionModel.amount >= min_amount)
-    if max_amount is not None:
-        query = query.filter(TransactionModel.amount <= max_amount)
-    
-    # Apply search
-    if search:
-        search_term = f"%{search.lower()}%"
-        query = query.filter(
+    # Search results are unbounded in variety and not worth caching;
+    # honor Cache-Control: no-cache for forced refreshes
+    cacheable = not search and (
+        request is None or "no-cache" not in request.headers.get("cache-control", "")
+    )
+    cache_key = (
+        "list", account_id, category_id, start_date, end_date,
+        transaction_type, min_amount, max_amount, sort_by, sort_order, limit, offset, after,
+    )
+    if cacheable:
+        body = _read_cache_get(cache_key)
+        if body is not None:
+            return Response(content=body, media_type="application/json")
+
+    # Core column select joined to accounts/account_types/categories:
+    # the rows become plain dicts, skipping ORM instance construction
+    # and Pydantic re-validation for the hot list path
+    stmt = (
+        select(
+            TransactionModel.id, TransactionModel.account_id, TransactionModel.category_id,
+            TransactionModel.amount, TransactionModel.description,
+            TransactionModel.transaction_date, TransactionModel.type,
+            TransactionModel.ai_category_id, TransactionModel.ai_confidence,
+            TransactionModel.is_ai_categorized, TransactionModel.user_corrected,
+            TransactionModel.created_at, TransactionModel.updated_at,
+            AccountModel.name.label('acct_name'),
+            AccountModel.account_type_id.label('acct_account_type_id'),
+            AccountModel.balance.label('acct_balance'),
+            AccountModel.institution.label('acct_institution'),
+            AccountModel.account_number.label('acct_account_number'),
+            AccountModel.currency.label('acct_currency'),
+            AccountModel.is_active.label('acct_is_active'),
+            AccountModel.created_at.label('acct_created_at'),
+            AccountModel.updated_at.label('acct_updated_at'),
+            AccountTypeModel.name.label('type_name'),
+            AccountTypeModel.category.label('type_category'),
+            AccountTypeModel.sub_category.label('type_sub_category'),
+            AccountTypeModel.created_at.label('type_created_at'),
+            AccountTypeModel.updated_at.label('type_updated_at'),
+            CategoryModel.name.label('cat_name'),
+            CategoryModel.type.label('cat_type'),
+            CategoryModel.color.label('cat_color'),
+            CategoryModel.created_at.label('cat_created_at'),
+            CategoryModel.updated_at.label('cat_updated_at'),
+        )
+        .join(AccountModel, TransactionModel.account_id == AccountModel.id)
+        .join(AccountTypeModel, AccountModel.account_type_id == AccountTypeModel.id)
+        .join(CategoryModel, TransactionModel.category_id == CategoryModel.id)
+    )
+
+    # Apply filters (shared with /summary)
+    stmt = apply_transaction_filters(
+        stmt,
+        account_id=account_id,
+        category_id=category_id,
+        start_date=start_date,
+        end_date=end_date,
+        transaction_type=transaction_type,
+        min_amount=min_amount,
+        max_amount=max_amount,
+        search=search,
+    )
+
+    if after:
+        # Keyset pagination: O(limit) per page regardless of depth, vs
+        # OFFSET scanning and discarding all earlier rows. Only defined
+        # for the default (transaction_date desc) ordering.
+        if sort_by != "transaction_date" or sort_order.lower() != "desc":
+            raise HTTPException(
+                status_code=400,
+                detail="Cursor pagination requires the default transaction_date desc sort"
+            )
+        try:
+            cursor_date, cursor_id = orjson.loads(base64.urlsafe_b64decode(after))
+            cursor_date = date.fromisoformat(cursor_date)
+            cursor_id = uuid.UUID(cursor_id)
+        except Exception:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        stmt = stmt.where(
             or_(
-                func.lower(TransactionModel.description).like(search_term),
-                # Note: We'd need to join with account/category for searching by name
-                # For now, just search description
+                TransactionModel.transaction_date < cursor_date,
+                and_(
+                    TransactionModel.transaction_date == cursor_date,
+                    TransactionModel.id < cursor_id
+                )
             )
         )
-    
-    # Apply sorting
-    if sort_by and hasattr(TransactionModel, sort_by):
-        sort_column = getattr(TransactionModel, sort_by)
-        if sort_order.lower() == "asc":
-            query = query.order_by(sort_column.asc())
+        stmt = stmt.order_by(
+            TransactionModel.transaction_date.desc(), TransactionModel.id.desc()
+        ).limit(limit)
+    else:
+        # Offset path kept for back-compat with existing clients
+        if sort_by and hasattr(TransactionModel, sort_by):
+            sort_column = getattr(TransactionModel, sort_by)
+            if sort_order.lower() == "asc":
+                stmt = stmt.order_by(sort_column.asc())
+            else:
+                stmt = stmt.order_by(sort_column.desc())
         else:
-            query = query.order_by(sort_column.desc())
+            stmt = stmt.order_by(TransactionModel.transaction_date.desc())
+        stmt = stmt.offset(offset).limit(limit)
+
+    rows = (await db.execute(stmt)).mappings().all()
+    items = [
+        {
+            "id": r["id"],
+            "account_id": r["account_id"],
+            "category_id": r["category_id"],
+            # Decimals go out as strings, matching the pydantic JSON
+            # serialization the detail endpoint and frontend types expect
+            "amount": str(r["amount"]),
+            "description": r["description"],
+            "transaction_date": r["transaction_date"],
+            "type": r["type"],
+            "ai_category_id": r["ai_category_id"],
+            "ai_confidence": r["ai_confidence"],
+            "is_ai_categorized": r["is_ai_categorized"],
+            "user_corrected": r["user_corrected"],
+            "created_at": r["created_at"],
+            "updated_at": r["updated_at"],
+            "account": {
+                "id": r["account_id"],
+                "name": r["acct_name"],
+                "account_type_id": r["acct_account_type_id"],
+                "balance": str(r["acct_balance"]),
+                "institution": r["acct_institution"],
+                "account_number": r["acct_account_number"],
+                "currency": r["acct_currency"],
+                "is_active": r["acct_is_active"],
+                "created_at": r["acct_created_at"],
+                "updated_at": r["acct_updated_at"],
+                "account_type": {
+                    "id": r["acct_account_type_id"],
+                    "name": r["type_name"],
+                    "category": r["type_category"],
+                    "sub_category": r["type_sub_category"],
+                    "created_at": r["type_created_at"],
+                    "updated_at": r["type_updated_at"],
+                },
+            },
+            "category": {
+                "id": r["category_id"],
+                "name": r["cat_name"],
+                "type": r["cat_type"],
+                "color": r["cat_color"],
+                "created_at": r["cat_created_at"],
+                "updated_at": r["cat_updated_at"],
+            },
+        }
+        for r in rows
+    ]
+    if after:
+        next_cursor = None
+        if len(rows) == limit:
+            last = rows[-1]
+            next_cursor = base64.urlsafe_b64encode(
+                orjson.dumps([last["transaction_date"].isoformat(), str(last["id"])])
+            ).decode()
+        body = orjson.dumps({"items": items, "next_cursor": next_cursor})
     else:
-        query = query.order_by(TransactionModel.transaction_date.desc())
-    
-    # Apply pagination
-    query = query.offset(offset).limit(limit)
-    
-    return query.all()
+        body = orjson.dumps(items)
+    if cacheable:
+        _read_cache_put(cache_key, body)
+    return Response(content=body, media_type="application/json")
 
 @router.get("/summary")
-def get_transaction_summary(
-    account_id: Optional[str] = Query(None),
-    category_id: Optional[str] = Query(None),
+async def get_transaction_summary(
+    account_id: Optional[uuid.UUID] = Query(None),
+    category_id: Optional[uuid.UUID] = Query(None),
     start_date: Optional[date] = Query(None),
     end_date: Optional[date] = Query(None),
     transaction_type: Optional[str] = Query(None),
     min_amount: Optional[Decimal] = Query(None),
     max_amount: Optional[Decimal] = Query(None),
     search: Optional[str] = Query(None),
-    db: Session = Depends(get_db)
+    request: Request = None,
+    db: AsyncSession = Depends(get_db)
 ):
     """Get transaction summary statistics with same filters as main endpoint"""
+    cacheable = not search and (
+        request is None or "no-cache" not in request.headers.get("cache-control", "")
+    )
+    cache_key = (
+        "summary", account_id, category_id, start_date, end_date,
+        transaction_type, min_amount, max_amount,
+    )
+    if cacheable:
+        body = _read_cache_get(cache_key)
+        if body is not None:
+            return Response(content=body, media_type="application/json")
+
     try:
-        query = db.query(TransactionModel)
-        
-        # Apply same filters as main endpoint
-        if account_id:
-            query = query.filter(TransactionModel.account_id == account_id)
-        if category_id:
-            query = query.filter(TransactionModel.category_id == category_id)
-        if start_date:
-            query = query.filter(TransactionModel.transaction_date >= start_date)
-        if end_date:
-            query = query.filter(TransactionModel.transaction_date <= end_date)
-        if transaction_type:
-            query = query.filter(TransactionModel.type == transaction_type)
-        if min_amount is not None:
-            query = query.filter(TransactionModel.amount >= min_amount)
-        if max_amount is not None:
-            query = query.filter(TransactionModel.amount <= max_amount)
-        
-        if search:
-            search_term = f"%{search.lower()}%"
-            query = query.filter(func.lower(TransactionModel.description).like(search_term))
-        
-        transactions = query.all()
-        
-        total_count = len(transactions)
-        total_income = sum(float(t.amount) for t in transactions if t.type == "INCOME")
-        total_expense = sum(float(t.amount) for t in transactions if t.type == "EXPENSE")
-        net_amount = total_income - total_expense
-        
-        return {
+        # Conditional aggregates: the DB returns three scalars instead of
+        # streaming every matching row for summing in Python
+        # Sum the generated integer-cents column: bigint aggregation is
+        # far cheaper than numeric and returns a plain int
+        stmt = select(
+            func.count(TransactionModel.id),
+            func.coalesce(
+                func.sum(case((TransactionModel.type == "INCOME", TransactionModel.amount_cents), else_=0)), 0
+            ),
+            func.coalesce(
+                func.sum(case((TransactionModel.type == "EXPENSE", TransactionModel.amount_cents), else_=0)), 0
+            ),
+        )
+        stmt = apply_transaction_filters(
+            stmt,
+            account_id=account_id,
+            category_id=category_id,
+            start_date=start_date,
+            end_date=end_date,
+            transaction_type=transaction_type,
+            min_amount=min_amount,
+            max_amount=max_amount,
+            search=search,
+        )
+
+        total_count, income_cents, expense_cents = (await db.execute(stmt)).one()
+
+        body = orjson.dumps({
             "total_count": total_count,
-            "total_income": total_income,
-            "total_expense": total_expense,
-            "net_amount": net_amount
-        }
+            "total_income": income_cents / 100,
+            "total_expense": expense_cents / 100,
+            "net_amount": (income_cents - expense_cents) / 100
+        })
+        if cacheable:
+            _read_cache_put(cache_key, body)
+        return Response(content=body, media_type="application/json")
     except Exception as e:
         # Return default values if there's an error
         return {
@@ -134,101 +322,235 @@ def get_transaction_summary(
             "net_amount": 0.0
         }
 
-@router.get("/{transaction_id}", response_model=Transaction)
-def get_transaction(transaction_id: str, db: Session = Depends(get_db)):
+@router.get("/{transaction_id}")
+async def get_transaction(transaction_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
     """Get a specific transaction"""
-    transaction = db.query(TransactionModel).filter(TransactionModel.id == transaction_id).first()
+    transaction = await db.scalar(
+        select(TransactionModel)
+        .options(
+            selectinload(TransactionModel.account).selectinload(AccountModel.account_type),
+            selectinload(TransactionModel.category),
+            raiseload('*')
+        )
+        .where(TransactionModel.id == transaction_id)
+    )
     if not transaction:
         raise HTTPException(status_code=404, detail="Transaction not found")
-    return transaction
+    return _transaction_response(transaction)
 
-@router.post("/", response_model=Transaction, status_code=201)
-def create_transaction(transaction: TransactionCreate, db: Session = Depends(get_db)):
+@router.post("/", status_code=201)
+async def create_transaction(transaction: TransactionCreate, db: AsyncSession = Depends(get_db)):
     """Create a new transaction"""
-    transaction_data = transaction.dict()
-    transaction_data["id"] = str(uuid.uuid4())
-    
+    transaction_data = transaction.model_dump()
+    transaction_data["id"] = uuid7()
+
     db_transaction = TransactionModel(**transaction_data)
     db.add(db_transaction)
-    db.commit()
-    db.refresh(db_transaction)
-    return db_transaction
-
-@router.put("/{transaction_id}", response_model=Transaction)
-def update_transaction(
-    transaction_id: str, 
-    transaction_update: TransactionUpdate, 
-    db: Session = Depends(get_db)
+    await db.commit()
+    _invalidate_read_cache()
+    # Reload with account/category for response serialization
+    return _transaction_response(await db.scalar(
+        select(TransactionModel)
+        .options(
+            selectinload(TransactionModel.account).selectinload(AccountModel.account_type),
+            selectinload(TransactionModel.category),
+            raiseload('*')
+        )
+        .where(TransactionModel.id == db_transaction.id)
+    ), status_code=201)
+
+@router.put("/{transaction_id}")
+async def update_transaction(
+    transaction_id: uuid.UUID,
+    transaction_update: TransactionUpdate,
+    db: AsyncSession = Depends(get_db)
 ):
     """Update a transaction"""
-    transaction = db.query(TransactionModel).filter(TransactionModel.id == transaction_id).first()
+    transaction = await db.scalar(
+        select(TransactionModel).where(TransactionModel.id == transaction_id)
+    )
     if not transaction:
         raise HTTPException(status_code=404, detail="Transaction not found")
-    
-    update_data = transaction_update.dict(exclude_unset=True)
-    
+
+    update_data = transaction_update.model_dump(exclude_unset=True)
+
     try:
         # Update all provided fields (Pydantic schema handles validation)
         for field, value in update_data.items():
             setattr(transaction, field, value)
-        
-        db.commit()
-        db.refresh(transaction)
-        return transaction
+
+        await db.commit()
+        _invalidate_read_cache()
+        # Reload with account/category for response serialization
+        return _transaction_response(await db.scalar(
+            select(TransactionModel)
+            .options(
+                selectinload(TransactionModel.account).selectinload(AccountModel.account_type),
+                selectinload(TransactionModel.category),
+                raiseload('*')
+            )
+            .where(TransactionModel.id == transaction_id)
+        ))
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=500,
             detail=f"Failed to update transaction: {str(e)}"
         )
 
 @router.delete("/{transaction_id}")
-def delete_transaction(transaction_id: str, db: Session = Depends(get_db)):
+async def delete_transaction(transaction_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
     """Delete a transaction"""
-    transaction = db.query(TransactionModel).filter(TransactionModel.id == transaction_id).first()
+    transaction = await db.scalar(
+        select(TransactionModel).where(TransactionModel.id == transaction_id)
+    )
     if not transaction:
         raise HTTPException(status_code=404, detail="Transaction not found")
-    
-    db.delete(transaction)
-    db.commit()
+
+    await db.delete(transaction)
+    await db.commit()
+    _invalidate_read_cache()
     return {"message": "Transaction deleted successfully"}
 
 @router.get("/import/template")
 def download_import_template():
     """Download CSV import template"""
-    template_path = "/Users/lalexander/projects/piggy/backend/app/templates/transaction_import_template.csv"
     return FileResponse(
-        path=template_path,
-        filename="transaction_import_template.csv",
+        path=str(_TEMPLATE_PATH),
+        filename=_TEMPLATE_PATH.name,
         media_type="text/csv"
     )
 
+def _read_upload_df(contents, file_extension):
+    """Parse an uploaded spreadsheet into a DataFrame (CPU-bound)"""
+    # The pyarrow engine parses the raw bytes in C++ without first
+    # decoding the whole upload into a Python str
+    if file_extension == 'csv':
+        return pd.read_csv(io.BytesIO(contents), engine="pyarrow")
+    return pd.read_excel(io.BytesIO(contents))
+
+def _validate_preview_rows(df, accounts_by_name, categories_by_name):
+    """Row validation for preview; runs on a worker thread"""
+    valid_count = 0
+    errors = []
+    preview_rows = []
+
+    for index, row in df.iterrows():
+        try:
+            # Validate and parse data
+            transaction_date = pd.to_datetime(row['transaction_date']).date()
+            description = str(row['description']).strip()
+            amount = Decimal(str(row['amount']))
+            account_name = str(row['account_name']).strip()
+            category_name = str(row['category_name']).strip()
+
+            # Find account by name
+            account = accounts_by_name.get(account_name)
+            if not account:
+                errors.append(f"Row {index + 2}: Account '{account_name}' not found")
+                continue
+
+            # Find category by name (infer type from category)
+            category = categories_by_name.get(category_name)
+            if not category:
+                errors.append(f"Row {index + 2}: Category '{category_name}' not found")
+                continue
+
+            # Infer transaction type from category
+            transaction_type = category.type
+
+            # If we get here, the transaction is valid
+            valid_count += 1
+
+            # Add to preview (limit to first 10)
+            if len(preview_rows) < 10:
+                preview_rows.append({
+                    "transaction_date": transaction_date.isoformat(),
+                    "description": description,
+                    "amount": float(amount),
+                    "type": transaction_type,
+                    "account_name": account_name,
+                    "category_name": category_name
+                })
+
+        except (ValueError, InvalidOperation, TypeError) as e:
+            errors.append(f"Row {index + 2}: Data validation error - {str(e)}")
+            continue
+        except Exception as e:
+            errors.append(f"Row {index + 2}: Unexpected error - {str(e)}")
+            continue
+
+    return valid_count, errors, preview_rows
+
+def _validate_import_rows(df, accounts_by_name, categories_by_name):
+    """Vectorized coercion and record building; runs on a worker thread"""
+    errors = []
+    parsed_date = pd.to_datetime(df['transaction_date'], errors='coerce')
+    parsed_amount = pd.to_numeric(df['amount'], errors='coerce')
+    df['description'] = df['description'].astype(str).str.strip()
+    df['account_name'] = df['account_name'].astype(str).str.strip()
+    df['category_name'] = df['category_name'].astype(str).str.strip()
+    account_id = df['account_name'].map(accounts_by_name)
+    category = df['category_name'].map(categories_by_name)
+
+    for index in df.index[parsed_date.isna()]:
+        errors.append(f"Row {index + 2}: Data validation error - invalid transaction_date")
+    for index in df.index[parsed_amount.isna()]:
+        errors.append(f"Row {index + 2}: Data validation error - invalid amount")
+    for index in df.index[account_id.isna()]:
+        errors.append(f"Row {index + 2}: Account '{df.at[index, 'account_name']}' not found")
+    for index in df.index[category.isna()]:
+        errors.append(f"Row {index + 2}: Category '{df.at[index, 'category_name']}' not found")
+
+    valid_mask = (
+        parsed_date.notna() & parsed_amount.notna()
+        & account_id.notna() & category.notna()
+    )
+    valid = df[valid_mask]
+
+    # Columns without server defaults must be supplied explicitly.
+    # Amounts go through Decimal(str(...)) to avoid binding floats to
+    # the Numeric column.
+    records = [
+        (
+            uuid7(),
+            account_id.at[index],
+            categories_by_name[row.category_name][0],
+            Decimal(str(row.amount)),
+            row.description,
+            parsed_date.at[index].date(),
+            categories_by_name[row.category_name][1],
+            False,
+            False,
+        )
+        for index, row in zip(valid.index, valid.itertuples(index=False))
+    ]
+    return errors, records
+
 @router.post("/import/preview")
 async def preview_transactions(
     file: UploadFile = File(...),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Preview transactions from CSV, XLS, or XLSX file before importing"""
-    
+
     if not file.filename:
         raise HTTPException(status_code=400, detail="No filename provided")
-    
+
     file_extension = file.filename.lower().split('.')[-1]
     if file_extension not in ['csv', 'xls', 'xlsx']:
         raise HTTPException(
-            status_code=400, 
+            status_code=400,
             detail="File must be CSV, XLS, or XLSX format"
         )
-    
+
     try:
         contents = await file.read()
-        
-        # Read the file into a pandas DataFrame
-        if file_extension == 'csv':
-            df = pd.read_csv(io.StringIO(contents.decode('utf-8')))
-        else:
-            df = pd.read_excel(io.BytesIO(contents))
-        
+
+        # Parse on a worker thread so the CPU-bound tokenization can't
+        # stall other requests on the event loop
+        df = await anyio.to_thread.run_sync(_read_upload_df, contents, file_extension)
+
         # Validate required columns
         required_columns = ['transaction_date', 'description', 'amount', 'account_name', 'category_name']
         missing_columns = [col for col in required_columns if col not in df.columns]
@@ -237,66 +559,28 @@ async def preview_transactions(
                 status_code=400,
                 detail=f"Missing required columns: {', '.join(missing_columns)}"
             )
-        
-        # Process each row for validation
-        valid_count = 0
-        errors = []
-        preview_transactions = []
-        
-        for index, row in df.iterrows():
-            try:
-                # Validate and parse data
-                transaction_date = pd.to_datetime(row['transaction_date']).date()
-                description = str(row['description']).strip()
-                amount = Decimal(str(row['amount']))
-                account_name = str(row['account_name']).strip()
-                category_name = str(row['category_name']).strip()
-                
-                # Find account by name
-                account = db.query(AccountModel).filter(AccountModel.name == account_name).first()
-                if not account:
-                    errors.append(f"Row {index + 2}: Account '{account_name}' not found")
-                    continue
-                
-                # Find category by name (infer type from category)
-                category = db.query(CategoryModel).filter(
-                    CategoryModel.name == category_name
-                ).first()
-                if not category:
-                    errors.append(f"Row {index + 2}: Category '{category_name}' not found")
-                    continue
-                
-                # Infer transaction type from category
-                transaction_type = category.type
-                
-                # If we get here, the transaction is valid
-                valid_count += 1
-                
-                # Add to preview (limit to first 10)
-                if len(preview_transactions) < 10:
-                    preview_transactions.append({
-                        "transaction_date": transaction_date.isoformat(),
-                        "description": description,
-                        "amount": float(amount),
-                        "type": transaction_type,
-                        "account_name": account_name,
-                        "category_name": category_name
-                    })
-                
-            except (ValueError, InvalidOperation, TypeError) as e:
-                errors.append(f"Row {index + 2}: Data validation error - {str(e)}")
-                continue
-            except Exception as e:
-                errors.append(f"Row {index + 2}: Unexpected error - {str(e)}")
-                continue
-        
+
+        # Prefetch lookup tables once: per-row name queries made an
+        # N-row file cost 2N round-trips
+        accounts_by_name = {
+            a.name: a for a in (await db.scalars(select(AccountModel))).all()
+        }
+        categories_by_name = {
+            c.name: c for c in (await db.scalars(select(CategoryModel))).all()
+        }
+
+        # Row validation is pure CPU once the lookups are in hand
+        valid_count, errors, preview_rows = await anyio.to_thread.run_sync(
+            _validate_preview_rows, df, accounts_by_name, categories_by_name
+        )
+
         return {
             "valid_count": valid_count,
             "total_rows": len(df),
             "errors": errors,
-            "preview_transactions": preview_transactions
+            "preview_transactions": preview_rows
         }
-        
+
     except pd.errors.EmptyDataError:
         raise HTTPException(status_code=400, detail="File is empty")
     except pd.errors.ParserError:
@@ -307,29 +591,27 @@ async def preview_transactions(
 @router.post("/import")
 async def import_transactions(
     file: UploadFile = File(...),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Import transactions from CSV, XLS, or XLSX file"""
-    
+
     if not file.filename:
         raise HTTPException(status_code=400, detail="No filename provided")
-    
+
     file_extension = file.filename.lower().split('.')[-1]
     if file_extension not in ['csv', 'xls', 'xlsx']:
         raise HTTPException(
-            status_code=400, 
+            status_code=400,
             detail="File must be CSV, XLS, or XLSX format"
         )
-    
+
     try:
         contents = await file.read()
-        
-        # Read the file into a pandas DataFrame
-        if file_extension == 'csv':
-            df = pd.read_csv(io.StringIO(contents.decode('utf-8')))
-        else:
-            df = pd.read_excel(io.BytesIO(contents))
-        
+
+        # Parse on a worker thread so the CPU-bound tokenization can't
+        # stall other requests on the event loop
+        df = await anyio.to_thread.run_sync(_read_upload_df, contents, file_extension)
+
         # Validate required columns
         required_columns = ['transaction_date', 'description', 'amount', 'account_name', 'category_name']
         missing_columns = [col for col in required_columns if col not in df.columns]
@@ -338,74 +620,52 @@ async def import_transactions(
                 status_code=400,
                 detail=f"Missing required columns: {', '.join(missing_columns)}"
             )
-        
-        # Process each row
-        imported_count = 0
-        errors = []
-        
-        for index, row in df.iterrows():
-            try:
-                # Validate and parse data
-                transaction_date = pd.to_datetime(row['transaction_date']).date()
-                description = str(row['description']).strip()
-                amount = Decimal(str(row['amount']))
-                account_name = str(row['account_name']).strip()
-                category_name = str(row['category_name']).strip()
-                
-                # Find account by name
-                account = db.query(AccountModel).filter(AccountModel.name == account_name).first()
-                if not account:
-                    errors.append(f"Row {index + 2}: Account '{account_name}' not found")
-                    continue
-                
-                # Find category by name (infer type from category)
-                category = db.query(CategoryModel).filter(
-                    CategoryModel.name == category_name
-                ).first()
-                if not category:
-                    errors.append(f"Row {index + 2}: Category '{category_name}' not found")
-                    continue
-                
-                # Infer transaction type from category
-                transaction_type = category.type
-                
-                # Create transaction
-                db_transaction = TransactionModel(
-                    id=uuid.uuid4(),
-                    account_id=account.id,
-                    category_id=category.id,
-                    amount=amount,
-                    description=description,
-                    transaction_date=transaction_date,
-                    type=transaction_type
-                )
-                
-                db.add(db_transaction)
-                imported_count += 1
-                
-            except (ValueError, InvalidOperation, TypeError) as e:
-                errors.append(f"Row {index + 2}: Data validation error - {str(e)}")
-                continue
-            except Exception as e:
-                errors.append(f"Row {index + 2}: Unexpected error - {str(e)}")
-                continue
-        
-        # Commit if there are valid transactions
-        if imported_count > 0:
-            db.commit()
+
+        # Prefetch lookup tables once: per-row name queries made an
+        # N-row file cost 2N round-trips
+        accounts_by_name = {
+            a.name: a.id for a in (await db.scalars(select(AccountModel))).all()
+        }
+        categories_by_name = {
+            c.name: (c.id, c.type) for c in (await db.scalars(select(CategoryModel))).all()
+        }
+
+        # Vectorized coercion and record building happen off the event
+        # loop; only the DB work stays on this coroutine
+        errors, records = await anyio.to_thread.run_sync(
+            _validate_import_rows, df, accounts_by_name, categories_by_name
+        )
+        imported_count = len(records)
+
+        if records:
+            conn = await db.connection()
+            raw = (await conn.get_raw_connection()).driver_connection
+            # COPY ... FROM STDIN runs on the session's connection,
+            # inside its transaction, so commit/rollback semantics are
+            # unchanged
+            await raw.copy_records_to_table(
+                'transactions',
+                columns=[
+                    'id', 'account_id', 'category_id', 'amount', 'description',
+                    'transaction_date', 'type', 'is_ai_categorized', 'user_corrected',
+                ],
+                records=records,
+            )
+            await db.commit()
+            _invalidate_read_cache()
         else:
-            db.rollback()
-        
+            await db.rollback()
+
         return {
             "imported_count": imported_count,
             "total_rows": len(df),
             "errors": errors
         }
-        
+
     except pd.errors.EmptyDataError:
         raise HTTPException(status_code=400, detail="File is empty")
     except pd.errors.ParserError:
         raise HTTPException(status_code=400, detail="Unable to parse file. Please check the format")
     except Exception as e:
-        db.rollback()
-        raise HTTPException(status_code=500, detail=f"Import failed: {str(e)}")
\ No newline at end of file
+        await db.rollback()
+        raise HTTPException(status_code=500, detail=f"Import failed: {str(e)}")
@@ -1,17 +1,46 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from contextlib import contextmanager
-from typing import Generator
+from typing import AsyncGenerator, Generator
 from .config import settings
 
-# Create PostgreSQL engine with optimizations
+# Async PostgreSQL engine (asyncpg) used by the request handlers so DB I/O
+# doesn't block the event loop
+async_engine = create_async_engine(
+    settings.async_database_url,
+    echo=settings.debug,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_pool_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    pool_pre_ping=settings.db_pool_pre_ping,  # Verify connections
+    pool_recycle=settings.db_pool_recycle,
+    insertmanyvalues_page_size=1000,
+    # Cache compiled SQL and keep asyncpg's server-side prepared
+    # statements warm for the repeat-shape endpoint queries
+    query_cache_size=1200,
+    connect_args={
+        "server_settings": {"timezone": "UTC"},
+        "prepared_statement_cache_size": 500,
+    },
+)
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
+
+# Sync engine kept for Alembic, startup seeding and scripts
 engine = create_engine(
     settings.database_url,
     echo=settings.debug,
     pool_size=10,
     max_overflow=20,
     pool_pre_ping=True,  # Verify connections
+    insertmanyvalues_page_size=1000,
+    query_cache_size=1200,
     connect_args={"options": "-c timezone=UTC"}
 )
 
@@ -19,23 +48,58 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
 
-def get_db() -> Generator[Session, None, None]:
-    """Dependency to get database session"""
-    db = SessionLocal()
-    try:
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency to get async database session"""
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 @contextmanager
 def get_db_context() -> Generator[Session, None, None]:
-    """Context manager for database session"""
+    """Context manager for sync database session (seeding/scripts)"""
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
 
+# budgets.total_amount is maintained by this trigger (migration
+# a9f5c3d87e21); the service layer no longer recomputes it in Python,
+# so the bootstrap path must install it too. All statements are
+# idempotent so warm databases are unaffected.
+_BUDGET_TOTAL_TRIGGER_DDL = (
+    """
+    CREATE OR REPLACE FUNCTION update_budget_total() RETURNS trigger AS $$
+    DECLARE
+        target uuid;
+    BEGIN
+        target := COALESCE(NEW.budget_id, OLD.budget_id);
+        UPDATE budgets SET total_amount = (
+            SELECT COALESCE(SUM(yearly_amount), 0)
+            FROM budget_line_items
+            WHERE budget_id = target
+        ) WHERE id = target;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    "DROP TRIGGER IF EXISTS budget_line_items_total ON budget_line_items",
+    """
+    CREATE TRIGGER budget_line_items_total
+    AFTER INSERT OR UPDATE OR DELETE ON budget_line_items
+    FOR EACH ROW EXECUTE FUNCTION update_budget_total()
+    """,
+)
+
 def create_tables():
     """Create all tables in the database"""
-    Base.metadata.create_all(bind=engine)
\ No newline at end of file
+    # The trigram index on transactions.description needs pg_trgm; create
+    # it here so a fresh-database bootstrap doesn't depend on Alembic
+    # having run first
+    with engine.begin() as conn:
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    Base.metadata.create_all(bind=engine)
+    # create_all doesn't emit triggers, so install the budget-total
+    # trigger after the tables exist
+    with engine.begin() as conn:
+        for ddl in _BUDGET_TOTAL_TRIGGER_DDL:
+            conn.execute(text(ddl))
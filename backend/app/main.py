@@ -1,5 +1,8 @@
+import asyncio
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 
 from app.api.v1.api import api_router
@@ -8,8 +11,11 @@ from app.init_db import init_database
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Startup - Initialize database with seed data
-    init_database()
+    # Startup - Initialize database with seed data. init_database uses
+    # the sync engine, so run it on a thread to keep the event loop
+    # free while the worker boots
+    if settings.seed_on_startup:
+        await asyncio.to_thread(init_database)
     yield
     # Shutdown - cleanup code would go here if needed
 
@@ -17,7 +23,8 @@ app = FastAPI(
     title="Piggy API", 
     version="0.1.0",
     description="Personal Finance Management API",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware for frontend development
@@ -1,14 +1,13 @@
-from sqlalchemy import Column, String, Numeric, Boolean, DateTime, ForeignKey, Index
+from sqlalchemy import Column, String, Numeric, Boolean, DateTime, ForeignKey, Index, text
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
 from app.core.database import Base
-import uuid
 
 class Account(Base):
     __tablename__ = "accounts"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     name = Column(String, nullable=False)  # "Chase Checking", "Wealthsimple RRSP"
     account_type_id = Column(UUID(as_uuid=True), ForeignKey("account_types.id"), nullable=False)
     balance = Column(Numeric(12, 2), nullable=False, default=0)  # Current balance
@@ -22,11 +21,17 @@ class Account(Base):
     # PostgreSQL-optimized indexes
     __table_args__ = (
         Index('idx_account_type', 'account_type_id'),
-        Index('idx_account_active', 'is_active'),
+        # Partial index: only active rows, matching the default list filter
+        Index('ix_accounts_active', 'id', postgresql_where=text('is_active = true')),
         Index('idx_account_name', 'name'),
     )
     
-    # Relationships
-    account_type = relationship("AccountType", back_populates="accounts")
+    # Fetch server-generated defaults (id, timestamps) via RETURNING
+    __mapper_args__ = {"eager_defaults": True}
+
+    # Relationships. account_type feeds response serialization, so it
+    # must always be eager-loaded explicitly; lazy="raise" turns an
+    # accidental per-row load into an immediate error
+    account_type = relationship("AccountType", back_populates="accounts", lazy="raise")
     transactions = relationship("Transaction", back_populates="account")
     balance_history = relationship("BalanceHistory", back_populates="account")
\ No newline at end of file
@@ -1,19 +1,25 @@
-from sqlalchemy import Column, String, DateTime
+from sqlalchemy import Column, String, DateTime, UniqueConstraint, text
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
 from app.core.database import Base
-import uuid
 
 class AccountType(Base):
     __tablename__ = "account_types"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    name = Column(String, unique=True, nullable=False)  # "Checking", "Credit Card", "Investment"
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
+    name = Column(String, nullable=False)  # "Checking", "Credit Card", "Investment"
     category = Column(String, nullable=False)  # "ASSET" or "LIABILITY"
     sub_category = Column(String, nullable=False)  # "cash", "investment", "debt", "real_estate"
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
-    
+
+    # Named so seeders can target it with ON CONFLICT (constraint=...)
+    __table_args__ = (
+        UniqueConstraint('name', name='uq_account_types_name'),
+    )
+
+    __mapper_args__ = {"eager_defaults": True}
+
     # Relationships
     accounts = relationship("Account", back_populates="account_type")
\ No newline at end of file
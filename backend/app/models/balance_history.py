@@ -1,21 +1,29 @@
-from sqlalchemy import Column, String, Numeric, DateTime, ForeignKey, Text
+from sqlalchemy import Column, Computed, String, Numeric, DateTime, ForeignKey, Text, Index, text
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
 from app.core.database import Base
-import uuid
 
 class BalanceHistory(Base):
     __tablename__ = "balance_history"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     account_id = Column(UUID(as_uuid=True), ForeignKey("accounts.id"), nullable=False)
     previous_balance = Column(Numeric(12, 2), nullable=False)  # Balance before change
     new_balance = Column(Numeric(12, 2), nullable=False)       # Balance after change
-    change_amount = Column(Numeric(12, 2), nullable=False)     # Amount of change (+/-)
+    change_amount = Column(  # Amount of change (+/-), derived in the DB
+        Numeric(12, 2), Computed("new_balance - previous_balance", persisted=True), nullable=False
+    )
     change_reason = Column(String, nullable=True)              # "manual_update", "transaction", "correction"
     notes = Column(Text, nullable=True)                        # Additional context
     created_at = Column(DateTime, server_default=func.now())
-    
+
+    # Supports the per-account history listing ordered by recency
+    __table_args__ = (
+        Index('idx_balance_history_account_created', 'account_id', 'created_at'),
+    )
+
+    __mapper_args__ = {"eager_defaults": True}
+
     # Relationships
     account = relationship("Account", back_populates="balance_history")
\ No newline at end of file
@@ -1,15 +1,14 @@
-from sqlalchemy import Column, String, Integer, Numeric, Boolean, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, Computed, String, Integer, Numeric, Boolean, DateTime, ForeignKey, UniqueConstraint, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from sqlalchemy.dialects.postgresql import UUID
 from app.core.database import Base
-import uuid
 
 
 class Budget(Base):
     __tablename__ = "budgets"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     year = Column(Integer, nullable=False)
     name = Column(String, nullable=False)
     total_amount = Column(Numeric(12, 2), nullable=False)
@@ -17,8 +16,10 @@ class Budget(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
+    __mapper_args__ = {"eager_defaults": True}
+
     # Relationships
-    line_items = relationship("BudgetLineItem", back_populates="budget", cascade="all, delete-orphan")
+    line_items = relationship("BudgetLineItem", back_populates="budget", cascade="all, delete-orphan", lazy="selectin")
 
     # Constraints will be handled at the service level to ensure only one active budget per year
 
@@ -26,17 +27,25 @@ class Budget(Base):
 class BudgetLineItem(Base):
     __tablename__ = "budget_line_items"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     budget_id = Column(UUID(as_uuid=True), ForeignKey("budgets.id"), nullable=False)
     category_id = Column(UUID(as_uuid=True), ForeignKey("categories.id"), nullable=False)
     yearly_amount = Column(Numeric(12, 2), nullable=False)
-    monthly_amount = Column(Numeric(12, 2), nullable=False)
+    # Derived in the DB so the three write paths can't drift from
+    # yearly_amount / 12
+    monthly_amount = Column(
+        Numeric(12, 2),
+        Computed("round(yearly_amount / 12.0, 2)", persisted=True),
+        nullable=False,
+    )
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
+    __mapper_args__ = {"eager_defaults": True}
+
     # Relationships
     budget = relationship("Budget", back_populates="line_items")
-    category = relationship("Category")
+    category = relationship("Category", lazy="joined")
 
     # Constraints
     __table_args__ = (
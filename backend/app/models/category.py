@@ -1,15 +1,21 @@
-from sqlalchemy import Column, String, DateTime
+from sqlalchemy import Column, String, DateTime, UniqueConstraint, text
 from sqlalchemy.sql import func
 from sqlalchemy.dialects.postgresql import UUID
 from app.core.database import Base
-import uuid
 
 class Category(Base):
     __tablename__ = "categories"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    name = Column(String, unique=True, nullable=False)  # "Groceries", "Salary", "Utilities"
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
+    name = Column(String, nullable=False)  # "Groceries", "Salary", "Utilities"
     type = Column(String, nullable=False)  # "INCOME" or "EXPENSE"
     color = Column(String, nullable=True)  # For UI visualization
     created_at = Column(DateTime, server_default=func.now())
-    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
\ No newline at end of file
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+    # Named so seeders can target it with ON CONFLICT (constraint=...)
+    __table_args__ = (
+        UniqueConstraint('name', name='uq_categories_name'),
+    )
+
+    __mapper_args__ = {"eager_defaults": True}
\ No newline at end of file
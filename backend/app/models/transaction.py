@@ -1,19 +1,30 @@
-from sqlalchemy import Column, String, Numeric, DateTime, Date, Boolean, Float, ForeignKey, Index
+from sqlalchemy import BigInteger, Column, Computed, String, Numeric, DateTime, Date, Boolean, Float, ForeignKey, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
 from app.core.database import Base
-import uuid
+from uuid6 import uuid7
 
 class Transaction(Base):
     __tablename__ = "transactions"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    # Time-ordered UUIDv7: new rows land on the rightmost btree pages,
+    # avoiding the page splits random uuid4 keys cause under insert load
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     account_id = Column(UUID(as_uuid=True), ForeignKey("accounts.id"), nullable=False)
     category_id = Column(UUID(as_uuid=True), ForeignKey("categories.id"), nullable=False)
     amount = Column(Numeric(12, 2), nullable=False)
+    # Integer mirror of amount for aggregation: SUM over bigint avoids
+    # per-row Decimal overhead and ships 8-byte ints over the wire
+    amount_cents = Column(
+        BigInteger,
+        Computed("(amount * 100)::bigint", persisted=True),
+        nullable=False,
+    )
     description = Column(String, nullable=False)
-    transaction_date = Column(Date, nullable=False)
+    # Part of the composite pk: Postgres requires the partition key in
+    # every unique constraint on a partitioned table
+    transaction_date = Column(Date, nullable=False, primary_key=True)
     type = Column(String, nullable=False)  # "INCOME" or "EXPENSE"
     
     # AI categorization fields (for Phase 5)
@@ -27,13 +38,36 @@ class Transaction(Base):
     
     # PostgreSQL-optimized indexes for common queries
     __table_args__ = (
-        Index('idx_transaction_account_date', 'account_id', 'transaction_date'),
-        Index('idx_transaction_category', 'category_id'),
-        Index('idx_transaction_type', 'type'),
+        # Covering index: INCLUDE carries the columns the summary and
+        # filtered list read, enabling index-only scans
+        Index(
+            'idx_tx_account_date_cover', 'account_id', 'transaction_date',
+            postgresql_include=['amount', 'category_id', 'type', 'description'],
+        ),
+        Index('idx_transaction_category_date', 'category_id', 'transaction_date'),
+        # Covers the budget summary GROUP BY: type + date range filter,
+        # grouped by category, with amount carried for index-only scans
+        Index(
+            'idx_tx_type_date_cat', 'type', 'transaction_date', 'category_id',
+            postgresql_include=['amount'],
+        ),
         Index('idx_transaction_date', 'transaction_date'),
+        # Trigram index so ILIKE '%term%' description search can use an
+        # index scan (requires the pg_trgm extension)
+        Index(
+            'idx_tx_description_trgm', 'description',
+            postgresql_using='gin',
+            postgresql_ops={'description': 'gin_trgm_ops'},
+        ),
+        # Yearly range partitioning lives in the Alembic migration only:
+        # declaring it here would make create_all() emit a partitioned
+        # parent with no partitions on a fresh database, breaking inserts
     )
     
-    # Relationships
-    account = relationship("Account", back_populates="transactions")
-    category = relationship("Category", foreign_keys=[category_id])
-    ai_category = relationship("Category", foreign_keys=[ai_category_id])
\ No newline at end of file
+    __mapper_args__ = {"eager_defaults": True}
+
+    # Relationships: all response-facing, so lazy loads are disallowed;
+    # callers opt in with selectinload
+    account = relationship("Account", back_populates="transactions", lazy="raise")
+    category = relationship("Category", foreign_keys=[category_id], lazy="raise")
+    ai_category = relationship("Category", foreign_keys=[ai_category_id], lazy="raise")
\ No newline at end of file
@@ -18,4 +18,4 @@ __all__ = [
     "Budget", "BudgetCreate", "BudgetUpdate", "BudgetWithLineItems",
     "BudgetLineItem", "BudgetLineItemCreate", "BudgetLineItemUpdate", "BudgetLineItemWithCategory",
     "BudgetSummary", "MonthlyBudgetProgress"
-]
\ No newline at end of file
+]
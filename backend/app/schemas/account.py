@@ -1,16 +1,26 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional
+from typing import Annotated, Optional
 from uuid import UUID
 from .account_type import AccountType
 
+# Field constraints enforced in pydantic-core (replaces the old
+# Python-level validate_account_data checks in the accounts router)
+AccountName = Annotated[str, StringConstraints(min_length=2, max_length=100, strip_whitespace=True)]
+Institution = Annotated[str, StringConstraints(max_length=100, strip_whitespace=True)]
+AccountNumber = Annotated[str, StringConstraints(max_length=4, pattern=r"^\d*$", strip_whitespace=True)]
+Balance = Annotated[
+    Decimal,
+    Field(ge=Decimal('-999999999.99'), le=Decimal('999999999.99'), decimal_places=2)
+]
+
 class AccountBase(BaseModel):
-    name: str
+    name: AccountName
     account_type_id: UUID
-    balance: Decimal = Field(default=Decimal('0.00'), decimal_places=2)
-    institution: Optional[str] = None
-    account_number: Optional[str] = None
+    balance: Balance = Decimal('0.00')
+    institution: Optional[Institution] = None
+    account_number: Optional[AccountNumber] = None
     currency: str = "CAD"
     is_active: bool = True
 
@@ -18,11 +28,11 @@ class AccountCreate(AccountBase):
     pass
 
 class AccountUpdate(BaseModel):
-    name: Optional[str] = None
+    name: Optional[AccountName] = None
     account_type_id: Optional[UUID] = None
-    balance: Optional[Decimal] = None
-    institution: Optional[str] = None
-    account_number: Optional[str] = None
+    balance: Optional[Balance] = None
+    institution: Optional[Institution] = None
+    account_number: Optional[AccountNumber] = None
     currency: Optional[str] = None
     is_active: Optional[bool] = None
 
@@ -31,6 +41,5 @@ class Account(AccountBase):
     created_at: datetime
     updated_at: datetime
     account_type: Optional[AccountType] = None
-    
-    class Config:
-        from_attributes = True
\ No newline at end of file
+
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='forbid')
@@ -1,16 +1,27 @@
-from pydantic import BaseModel, validator
+import time
+from functools import lru_cache
+from pydantic import BaseModel, ConfigDict, field_validator
 from typing import List, Optional
 from decimal import Decimal
 from datetime import datetime
 import uuid
 from app.schemas.category import Category
 
+@lru_cache(maxsize=1)
+def _current_year(minute: int) -> int:
+    return datetime.now().year
+
+def current_year() -> int:
+    """Current year, refreshed at most once per minute"""
+    return _current_year(int(time.monotonic() // 60))
+
 
 class BudgetLineItemBase(BaseModel):
     category_id: uuid.UUID
     yearly_amount: Decimal
     
-    @validator('yearly_amount')
+    @field_validator('yearly_amount')
+    @classmethod
     def yearly_amount_must_be_positive(cls, v):
         if v <= 0:
             raise ValueError('Yearly amount must be positive')
@@ -25,7 +36,8 @@ class BudgetLineItemUpdate(BaseModel):
     category_id: Optional[uuid.UUID] = None
     yearly_amount: Optional[Decimal] = None
     
-    @validator('yearly_amount')
+    @field_validator('yearly_amount')
+    @classmethod
     def yearly_amount_must_be_positive(cls, v):
         if v is not None and v <= 0:
             raise ValueError('Yearly amount must be positive')
@@ -38,9 +50,8 @@ class BudgetLineItem(BudgetLineItemBase):
     monthly_amount: Decimal
     created_at: datetime
     updated_at: datetime
-    
-    class Config:
-        from_attributes = True
+
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='forbid')
 
 
 class BudgetLineItemWithCategory(BudgetLineItem):
@@ -51,11 +62,12 @@ class BudgetBase(BaseModel):
     year: int
     name: str
     
-    @validator('year')
+    @field_validator('year')
+    @classmethod
     def year_must_be_reasonable(cls, v):
-        current_year = datetime.now().year
-        if v < current_year - 10 or v > current_year + 10:
-            raise ValueError(f'Year must be between {current_year - 10} and {current_year + 10}')
+        this_year = current_year()
+        if v < this_year - 10 or v > this_year + 10:
+            raise ValueError(f'Year must be between {this_year - 10} and {this_year + 10}')
         return v
 
 
@@ -68,12 +80,13 @@ class BudgetUpdate(BaseModel):
     name: Optional[str] = None
     is_active: Optional[bool] = None
     
-    @validator('year')
+    @field_validator('year')
+    @classmethod
     def year_must_be_reasonable(cls, v):
         if v is not None:
-            current_year = datetime.now().year
-            if v < current_year - 10 or v > current_year + 10:
-                raise ValueError(f'Year must be between {current_year - 10} and {current_year + 10}')
+            this_year = current_year()
+            if v < this_year - 10 or v > this_year + 10:
+                raise ValueError(f'Year must be between {this_year - 10} and {this_year + 10}')
         return v
 
 
@@ -83,9 +96,8 @@ class Budget(BudgetBase):
     is_active: bool
     created_at: datetime
     updated_at: datetime
-    
-    class Config:
-        from_attributes = True
+
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='forbid')
 
 
 class BudgetWithLineItems(Budget):
@@ -107,4 +119,4 @@ class MonthlyBudgetProgress(BaseModel):
     spent_amount: Decimal
     remaining_amount: Decimal
     progress_percentage: float
-    categories: List[dict]
\ No newline at end of file
+    categories: List[dict]
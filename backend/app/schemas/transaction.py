@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime, date
 from decimal import Decimal
 from typing import Optional
@@ -35,6 +35,6 @@ class Transaction(TransactionBase):
     updated_at: datetime
     account: Optional[Account] = None
     category: Optional[Category] = None
-    
-    class Config:
-        from_attributes = True
\ No newline at end of file
+
+    # Read model: frozen skips mutability bookkeeping per instance
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='forbid')
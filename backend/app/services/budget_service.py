@@ -1,10 +1,15 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import func, extract
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
+from sqlalchemy.orm.attributes import set_committed_value
 from typing import List, Optional
 from decimal import Decimal
-from datetime import datetime
+from datetime import date, datetime
+import time
 import uuid
 
+import numpy as np
+
 from app.models.budget import Budget, BudgetLineItem
 from app.models.category import Category
 from app.models.transaction import Transaction
@@ -14,197 +19,231 @@ from app.schemas.budget import (
 )
 
 
+# Per-process cache of the active budget, loaded with its line items
+# and categories so the dashboard can read it fully detached. The
+# single entry is cleared on every budget write; the TTL bounds
+# staleness across workers that didn't see the write.
+_ACTIVE_BUDGET_TTL = 30.0
+_active_budget_cache: dict[str, tuple[float, "Budget"]] = {}
+
+
+def _invalidate_active_budget_cache() -> None:
+    _active_budget_cache.clear()
+
+
 class BudgetService:
-    
-    def __init__(self, db: Session):
+
+    def __init__(self, db: AsyncSession):
         self.db = db
-    
-    def create_budget(self, budget_data: BudgetCreate) -> Budget:
+
+    async def create_budget(self, budget_data: BudgetCreate) -> Budget:
         """Create a new budget with line items"""
         # Calculate total amount from line items
         total_amount = sum(item.yearly_amount for item in budget_data.line_items)
-        
-        # Create budget
+
+        # Create budget; id comes from the server default and is
+        # returned by the flush (eager_defaults)
         db_budget = Budget(
-            id=uuid.uuid4(),
             year=budget_data.year,
             name=budget_data.name,
             total_amount=total_amount,
             is_active=True
         )
-        
+
         self.db.add(db_budget)
-        self.db.flush()  # Get the ID
-        
-        # Create line items
-        for item_data in budget_data.line_items:
-            monthly_amount = item_data.yearly_amount / 12
-            
-            line_item = BudgetLineItem(
-                id=uuid.uuid4(),
-                budget_id=db_budget.id,
-                category_id=item_data.category_id,
-                yearly_amount=item_data.yearly_amount,
-                monthly_amount=monthly_amount
+        # This flush IS the budget INSERT: the row has to exist before
+        # the line items' FK bulk insert below, so it costs nothing extra
+        await self.db.flush()
+
+        # Create line items with a single multi-row INSERT instead of
+        # unit-of-work state per row; ids come from the server default
+        if budget_data.line_items:
+            await self.db.execute(
+                insert(BudgetLineItem),
+                [
+                    {
+                        "budget_id": db_budget.id,
+                        "category_id": item_data.category_id,
+                        "yearly_amount": item_data.yearly_amount,
+                    }
+                    for item_data in budget_data.line_items
+                ],
             )
-            self.db.add(line_item)
-        
-        self.db.commit()
-        self.db.refresh(db_budget)
+
+        await self.db.commit()
+        _invalidate_active_budget_cache()
         return db_budget
-    
-    def get_budget_by_id(self, budget_id: uuid.UUID) -> Optional[Budget]:
-        """Get budget by ID"""
-        return self.db.query(Budget).filter(Budget.id == budget_id).first()
-    
-    def get_budget_by_year(self, year: int) -> Optional[Budget]:
+
+    async def get_budget_by_id(self, budget_id: uuid.UUID) -> Optional[Budget]:
+        """Get budget by ID (line items/categories load via model-level strategies)"""
+        return await self.db.get(Budget, budget_id)
+
+    async def get_budget_by_year(self, year: int) -> Optional[Budget]:
         """Get budget by year"""
-        return self.db.query(Budget).filter(Budget.year == year).first()
-    
-    def get_all_budgets(self, skip: int = 0, limit: int = 100) -> List[Budget]:
+        return await self.db.scalar(select(Budget).where(Budget.year == year))
+
+    async def get_all_budgets(self, skip: int = 0, limit: int = 100) -> List[Budget]:
         """Get all budgets with pagination"""
-        return self.db.query(Budget).offset(skip).limit(limit).all()
-    
-    def update_budget(self, budget_id: uuid.UUID, budget_data: BudgetUpdate) -> Optional[Budget]:
+        # List view only needs budget columns; hard-fail on accidental lazy access
+        return (await self.db.scalars(
+            select(Budget).options(raiseload("*")).offset(skip).limit(limit)
+        )).all()
+
+    async def update_budget(self, budget_id: uuid.UUID, budget_data: BudgetUpdate) -> Optional[Budget]:
         """Update budget basic information"""
-        db_budget = self.get_budget_by_id(budget_id)
+        db_budget = await self.get_budget_by_id(budget_id)
         if not db_budget:
             return None
-        
-        update_data = budget_data.dict(exclude_unset=True)
+
+        update_data = budget_data.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(db_budget, field, value)
-        
-        self.db.commit()
-        self.db.refresh(db_budget)
+
+        await self.db.commit()
+        _invalidate_active_budget_cache()
         return db_budget
-    
-    def delete_budget(self, budget_id: uuid.UUID) -> bool:
+
+    async def delete_budget(self, budget_id: uuid.UUID) -> bool:
         """Delete budget and all line items"""
-        db_budget = self.get_budget_by_id(budget_id)
+        db_budget = await self.get_budget_by_id(budget_id)
         if not db_budget:
             return False
-        
-        self.db.delete(db_budget)
-        self.db.commit()
+
+        await self.db.delete(db_budget)
+        await self.db.commit()
+        _invalidate_active_budget_cache()
         return True
-    
-    def add_budget_line_item(self, budget_id: uuid.UUID, item_data: BudgetLineItemCreate) -> Optional[BudgetLineItem]:
+
+    async def add_budget_line_item(self, budget_id: uuid.UUID, item_data: BudgetLineItemCreate) -> Optional[BudgetLineItem]:
         """Add a line item to existing budget"""
-        db_budget = self.get_budget_by_id(budget_id)
+        db_budget = await self.get_budget_by_id(budget_id)
         if not db_budget:
             return None
-        
+
         # Check if category already exists in budget
-        existing = self.db.query(BudgetLineItem).filter(
-            BudgetLineItem.budget_id == budget_id,
-            BudgetLineItem.category_id == item_data.category_id
-        ).first()
-        
+        existing = await self.db.scalar(
+            select(BudgetLineItem).where(
+                BudgetLineItem.budget_id == budget_id,
+                BudgetLineItem.category_id == item_data.category_id
+            )
+        )
+
         if existing:
             return None  # Category already has a budget line item
-        
-        monthly_amount = item_data.yearly_amount / 12
-        
+
+        # id comes from the server-side gen_random_uuid() default
         line_item = BudgetLineItem(
-            id=uuid.uuid4(),
             budget_id=budget_id,
             category_id=item_data.category_id,
-            yearly_amount=item_data.yearly_amount,
-            monthly_amount=monthly_amount
+            yearly_amount=item_data.yearly_amount
         )
-        
+
         self.db.add(line_item)
-        
-        # Update budget total
-        db_budget.total_amount += item_data.yearly_amount
-        
-        self.db.commit()
-        self.db.refresh(line_item)
+
+        # budgets.total_amount is recomputed by a DB trigger on line
+        # item changes, so no read-modify-write here
+        await self.db.commit()
+        _invalidate_active_budget_cache()
         return line_item
-    
-    def update_budget_line_item(self, line_item_id: uuid.UUID, item_data: BudgetLineItemUpdate) -> Optional[BudgetLineItem]:
+
+    async def update_budget_line_item(self, line_item_id: uuid.UUID, item_data: BudgetLineItemUpdate) -> Optional[BudgetLineItem]:
         """Update budget line item"""
-        line_item = self.db.query(BudgetLineItem).filter(BudgetLineItem.id == line_item_id).first()
+        line_item = await self.db.scalar(
+            select(BudgetLineItem).where(BudgetLineItem.id == line_item_id)
+        )
         if not line_item:
             return None
-        
-        old_amount = line_item.yearly_amount
-        
-        update_data = item_data.dict(exclude_unset=True)
+
+        update_data = item_data.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(line_item, field, value)
-        
-        # Recalculate monthly amount if yearly amount changed
-        if 'yearly_amount' in update_data:
-            line_item.monthly_amount = line_item.yearly_amount / 12
-            
-            # Update budget total
-            budget = self.get_budget_by_id(line_item.budget_id)
-            if budget:
-                budget.total_amount = budget.total_amount - old_amount + line_item.yearly_amount
-        
-        self.db.commit()
-        self.db.refresh(line_item)
+
+        # monthly_amount is a generated column and the budget total is
+        # trigger-maintained, so nothing else to recompute here
+        await self.db.commit()
+        _invalidate_active_budget_cache()
         return line_item
-    
-    def delete_budget_line_item(self, line_item_id: uuid.UUID) -> bool:
+
+    async def delete_budget_line_item(self, line_item_id: uuid.UUID) -> bool:
         """Delete budget line item"""
-        line_item = self.db.query(BudgetLineItem).filter(BudgetLineItem.id == line_item_id).first()
+        line_item = await self.db.scalar(
+            select(BudgetLineItem).where(BudgetLineItem.id == line_item_id)
+        )
         if not line_item:
             return False
-        
-        # Update budget total
-        budget = self.get_budget_by_id(line_item.budget_id)
-        if budget:
-            budget.total_amount -= line_item.yearly_amount
-        
-        self.db.delete(line_item)
-        self.db.commit()
+
+        await self.db.delete(line_item)
+        await self.db.commit()
+        _invalidate_active_budget_cache()
         return True
-    
-    def get_budget_summary(self, budget_id: uuid.UUID) -> Optional[BudgetSummary]:
+
+    async def get_budget_summary(self, budget_id: uuid.UUID) -> Optional[BudgetSummary]:
         """Get budget summary with actual spending"""
-        budget = self.get_budget_by_id(budget_id)
+        budget = await self.get_budget_by_id(budget_id)
         if not budget:
             return None
-        
-        # Get total spent for the budget year
-        total_spent = self.db.query(func.sum(Transaction.amount)).filter(
-            Transaction.type == "EXPENSE",
-            extract('year', Transaction.transaction_date) == budget.year
-        ).scalar() or Decimal('0')
-        
+
+        # Half-open date range instead of extract('year', ...): a bare
+        # column predicate lets Postgres range-scan the date indexes
+        year_start = date(budget.year, 1, 1)
+        year_end = date(budget.year + 1, 1, 1)
+
+        # One ROLLUP pass computes the year's grand total and the
+        # per-category sums from a single index range scan; the
+        # NULL-key row is the total. It has to cover all expense
+        # categories for the total to be right, and names come from the
+        # line items anyway, so there is no Category join here.
+        spending_rows = (await self.db.execute(
+            select(
+                Transaction.category_id,
+                # coalesce in SQL so the empty-year total row comes back
+                # as 0 and no Python-side default branch is needed
+                func.coalesce(func.sum(Transaction.amount), 0).label('spent')
+            ).where(
+                Transaction.type == "EXPENSE",
+                Transaction.transaction_date >= year_start,
+                Transaction.transaction_date < year_end
+            ).group_by(func.rollup(Transaction.category_id))
+        )).all()
+
+        total_spent = next(
+            (row[1] for row in spending_rows if row[0] is None), Decimal('0')
+        )
+        spent_by_category = {
+            row[0]: row[1] for row in spending_rows if row[0] is not None
+        }
+
         remaining = budget.total_amount - total_spent
-        progress_percentage = float((total_spent / budget.total_amount) * 100) if budget.total_amount > 0 else 0
-        
-        # Get category-wise spending
-        category_spending = self.db.query(
-            Category.id,
-            Category.name,
-            func.sum(Transaction.amount).label('spent')
-        ).join(Transaction, Category.id == Transaction.category_id).filter(
-            Transaction.type == "EXPENSE",
-            extract('year', Transaction.transaction_date) == budget.year
-        ).group_by(Category.id, Category.name).all()
-        
-        categories_summary = []
-        for line_item in budget.line_items:
-            spent = Decimal('0')
-            for cat_spend in category_spending:
-                if cat_spend[0] == line_item.category_id:
-                    spent = cat_spend[2] or Decimal('0')
-                    break
-            
-            categories_summary.append({
-                'category_id': str(line_item.category_id),
-                'category_name': line_item.category.name if line_item.category else 'Unknown',
-                'budgeted': float(line_item.yearly_amount),
-                'spent': float(spent),
-                'remaining': float(line_item.yearly_amount - spent),
-                'progress_percentage': float((spent / line_item.yearly_amount) * 100) if line_item.yearly_amount > 0 else 0
-            })
-        
+        # Percentage is display-only: do it in float, Decimal division
+        # is an order of magnitude slower
+        total_budget_f = float(budget.total_amount)
+        progress_percentage = float(total_spent) / total_budget_f * 100.0 if total_budget_f > 0 else 0.0
+
+        # Vectorize the per-line-item arithmetic: one float64 pass
+        # instead of Decimal subtraction/division per row
+        line_items = budget.line_items
+        budgeted = np.fromiter(
+            (float(li.yearly_amount) for li in line_items), dtype=np.float64, count=len(line_items)
+        )
+        spent = np.fromiter(
+            (float(spent_by_category.get(li.category_id, Decimal('0'))) for li in line_items),
+            dtype=np.float64, count=len(line_items),
+        )
+        line_remaining = budgeted - spent
+        progress = np.divide(spent * 100, budgeted, out=np.zeros_like(spent), where=budgeted > 0)
+
+        categories_summary = [
+            {
+                'category_id': str(li.category_id),
+                'category_name': li.category.name if li.category else 'Unknown',
+                'budgeted': float(budgeted[i]),
+                'spent': float(spent[i]),
+                'remaining': float(line_remaining[i]),
+                'progress_percentage': float(progress[i]),
+            }
+            for i, li in enumerate(line_items)
+        ]
+
         return BudgetSummary(
             budget=budget,
             total_spent=total_spent,
@@ -212,54 +251,85 @@ class BudgetService:
             progress_percentage=progress_percentage,
             categories_summary=categories_summary
         )
-    
-    def get_monthly_budget_progress(self, budget_id: uuid.UUID, month: int) -> Optional[MonthlyBudgetProgress]:
+
+    async def get_monthly_budget_progress(self, budget_id: uuid.UUID, month: int) -> Optional[MonthlyBudgetProgress]:
         """Get budget progress for specific month"""
-        budget = self.get_budget_by_id(budget_id)
+        budget = await self.get_budget_by_id(budget_id)
         if not budget:
             return None
-        
+
         # Calculate monthly budgeted amount
         monthly_budgeted = budget.total_amount / 12
-        
-        # Get actual spending for the month
-        monthly_spent = self.db.query(func.sum(Transaction.amount)).filter(
-            Transaction.type == "EXPENSE",
-            extract('year', Transaction.transaction_date) == budget.year,
-            extract('month', Transaction.transaction_date) == month
-        ).scalar() or Decimal('0')
-        
+
+        # Index-friendly month bounds (see get_budget_summary)
+        month_start = date(budget.year, month, 1)
+        month_end = (
+            date(budget.year + 1, 1, 1) if month == 12
+            else date(budget.year, month + 1, 1)
+        )
+
+        # Get actual spending for the month; coalesce keeps the default
+        # in SQL so an empty month still yields a Decimal zero
+        monthly_spent = await self.db.scalar(
+            select(func.coalesce(func.sum(Transaction.amount), 0)).where(
+                Transaction.type == "EXPENSE",
+                Transaction.transaction_date >= month_start,
+                Transaction.transaction_date < month_end
+            )
+        )
+
         remaining = monthly_budgeted - monthly_spent
-        progress_percentage = float((monthly_spent / monthly_budgeted) * 100) if monthly_budgeted > 0 else 0
-        
-        # Get category-wise monthly activity (both income and expenses)
-        category_spending = self.db.query(
-            Category.id,
-            Category.name,
-            Category.type,
-            func.sum(Transaction.amount).label('spent')
-        ).join(Transaction, Category.id == Transaction.category_id).filter(
-            extract('year', Transaction.transaction_date) == budget.year,
-            extract('month', Transaction.transaction_date) == month
-        ).group_by(Category.id, Category.name, Category.type).all()
-        
-        categories = []
-        for line_item in budget.line_items:
-            spent = Decimal('0')
-            for cat_spend in category_spending:
-                if cat_spend[0] == line_item.category_id:
-                    spent = cat_spend[3] or Decimal('0')
-                    break
-            
-            categories.append({
-                'category_id': str(line_item.category_id),
-                'category_name': line_item.category.name if line_item.category else 'Unknown',
-                'monthly_budget': float(line_item.monthly_amount),
-                'spent': float(spent),
-                'remaining': float(line_item.monthly_amount - spent),
-                'progress_percentage': float((spent / line_item.monthly_amount) * 100) if line_item.monthly_amount > 0 else 0
-            })
-        
+        # Display-only percentage in float (see get_budget_summary)
+        monthly_budgeted_f = float(monthly_budgeted)
+        progress_percentage = float(monthly_spent) / monthly_budgeted_f * 100.0 if monthly_budgeted_f > 0 else 0.0
+
+        # Join the line items to the month's aggregated activity (both
+        # income and expenses) in SQL, so each row arrives with its
+        # spent amount and no Python-side join is needed
+        spent_subq = (
+            select(
+                Transaction.category_id,
+                func.sum(Transaction.amount).label('spent')
+            ).where(
+                Transaction.transaction_date >= month_start,
+                Transaction.transaction_date < month_end
+            ).group_by(Transaction.category_id)
+        ).subquery()
+
+        rows = (await self.db.execute(
+            select(
+                BudgetLineItem.category_id,
+                Category.name,
+                BudgetLineItem.monthly_amount,
+                func.coalesce(spent_subq.c.spent, 0).label('spent')
+            )
+            .join(Category, Category.id == BudgetLineItem.category_id)
+            .outerjoin(spent_subq, spent_subq.c.category_id == BudgetLineItem.category_id)
+            .where(BudgetLineItem.budget_id == budget_id)
+        )).all()
+
+        # Vectorized as in get_budget_summary
+        monthly_budget = np.fromiter(
+            (float(row[2]) for row in rows), dtype=np.float64, count=len(rows)
+        )
+        spent = np.fromiter(
+            (float(row[3]) for row in rows), dtype=np.float64, count=len(rows)
+        )
+        line_remaining = monthly_budget - spent
+        progress = np.divide(spent * 100, monthly_budget, out=np.zeros_like(spent), where=monthly_budget > 0)
+
+        categories = [
+            {
+                'category_id': str(row[0]),
+                'category_name': row[1],
+                'monthly_budget': float(monthly_budget[i]),
+                'spent': float(spent[i]),
+                'remaining': float(line_remaining[i]),
+                'progress_percentage': float(progress[i]),
+            }
+            for i, row in enumerate(rows)
+        ]
+
         return MonthlyBudgetProgress(
             month=month,
             year=budget.year,
@@ -269,111 +339,127 @@ class BudgetService:
             progress_percentage=progress_percentage,
             categories=categories
         )
-    
-    def get_active_budget(self) -> Optional[Budget]:
-        """Get the currently active budget"""
-        return self.db.query(Budget).filter(Budget.is_active == True).first()
-    
-    def set_active_budget(self, budget_id: uuid.UUID) -> Optional[Budget]:
+
+    async def get_active_budget(self) -> Optional[Budget]:
+        """Get the currently active budget (cached per process)"""
+        cached = _active_budget_cache.get('active')
+        if cached is not None and time.monotonic() - cached[0] < _ACTIVE_BUDGET_TTL:
+            return cached[1]
+
+        budget = await self.db.scalar(select(Budget).where(Budget.is_active == True))
+        if budget is not None:
+            # line_items/categories are selectin/joined-loaded here, so
+            # the detached instance is safe to read from other requests
+            _active_budget_cache['active'] = (time.monotonic(), budget)
+        return budget
+
+    async def set_active_budget(self, budget_id: uuid.UUID) -> Optional[Budget]:
         """Set a budget as active, ensuring only one active budget per year"""
-        target_budget = self.get_budget_by_id(budget_id)
+        target_budget = await self.get_budget_by_id(budget_id)
         if not target_budget:
             return None
-        
-        # Check if there's already an active budget for this year
-        existing_active = self.db.query(Budget).filter(
-            Budget.year == target_budget.year,
-            Budget.is_active == True,
-            Budget.id != budget_id
-        ).first()
-        
-        if existing_active:
-            existing_active.is_active = False
-        
-        target_budget.is_active = True
-        self.db.commit()
-        
-        self.db.refresh(target_budget)
+
+        # One statement flips the whole year: the target becomes active
+        # and any sibling active budget is cleared, replacing the extra
+        # SELECT + per-row UPDATEs
+        await self.db.execute(
+            update(Budget)
+            .where(Budget.year == target_budget.year)
+            .values(is_active=(Budget.id == budget_id))
+            .execution_options(synchronize_session=False)
+        )
+        # Mirror the statement's known outcome on the in-session
+        # instance so the response doesn't need a reload
+        set_committed_value(target_budget, 'is_active', True)
+        await self.db.commit()
+        _invalidate_active_budget_cache()
         return target_budget
-    
-    def get_dashboard_data(self, current_month: int) -> Optional[dict]:
+
+    async def get_dashboard_data(self, current_month: int) -> Optional[dict]:
         """Get dashboard data for the active budget with YTD calculations"""
-        active_budget = self.get_active_budget()
+        active_budget = await self.get_active_budget()
         if not active_budget:
             return None
-        
+
         current_year = active_budget.year
-        
-        # Calculate YTD budget amounts (cumulative through current month)
-        ytd_income_budget = Decimal('0')
-        ytd_expense_budget = Decimal('0')
-        
-        # Get categories by type
+
+        # YTD window: Jan 1 through the end of current_month, as a
+        # half-open range the date indexes can scan
+        ytd_start = date(current_year, 1, 1)
+        ytd_end = (
+            date(current_year + 1, 1, 1) if current_month == 12
+            else date(current_year, current_month + 1, 1)
+        )
+
+        # Get category-wise YTD actuals up front so the line-item pass
+        # below can stamp them while classifying; the income/expense
+        # totals are summed from these rows rather than issued as two
+        # extra aggregate queries over the same window
+        category_actuals = (await self.db.execute(
+            select(
+                Category.id,
+                Category.type,
+                func.sum(Transaction.amount).label('actual')
+            ).join(Transaction, Category.id == Transaction.category_id).where(
+                Transaction.transaction_date >= ytd_start,
+                Transaction.transaction_date < ytd_end
+            ).group_by(Category.id, Category.type)
+        )).all()
+
+        ytd_income_actual = sum(
+            (row[2] for row in category_actuals if row[1] == "INCOME"),
+            Decimal('0'),
+        )
+        ytd_expense_actual = sum(
+            (row[2] for row in category_actuals if row[1] == "EXPENSE"),
+            Decimal('0'),
+        )
+        actual_lookup = {row[0]: row[2] for row in category_actuals}
+
+        # Calculate YTD budget amounts (cumulative through current
+        # month). These are display values, so the per-line-item /12
+        # and *month math runs in float rather than Decimal
+        ytd_income_budget = 0.0
+        ytd_expense_budget = 0.0
+
+        # Single pass: classify by type and build the fully-populated
+        # dict, looking up actuals by the line item's UUID directly
         income_categories = []
         expense_categories = []
-        
+
         for line_item in active_budget.line_items:
-            monthly_amount = line_item.yearly_amount / 12
-            ytd_amount = monthly_amount * current_month
-            
+            yearly_budget = float(line_item.yearly_amount)
+            monthly_budget = yearly_budget / 12.0
+            ytd_budget = monthly_budget * current_month
+
             if line_item.category and line_item.category.type == "INCOME":
-                ytd_income_budget += ytd_amount
-                income_categories.append({
-                    'id': str(line_item.category_id),
-                    'name': line_item.category.name,
-                    'yearly_budget': float(line_item.yearly_amount),
-                    'monthly_budget': float(monthly_amount),
-                    'ytd_budget': float(ytd_amount)
-                })
+                ytd_income_budget += ytd_budget
+                target = income_categories
             elif line_item.category and line_item.category.type == "EXPENSE":
-                ytd_expense_budget += ytd_amount
-                expense_categories.append({
-                    'id': str(line_item.category_id),
-                    'name': line_item.category.name,
-                    'yearly_budget': float(line_item.yearly_amount),
-                    'monthly_budget': float(monthly_amount),
-                    'ytd_budget': float(ytd_amount)
-                })
-        
-        # Get actual YTD income/expense totals
-        ytd_income_actual = self.db.query(func.sum(Transaction.amount)).filter(
-            Transaction.type == "INCOME",
-            extract('year', Transaction.transaction_date) == current_year,
-            extract('month', Transaction.transaction_date) <= current_month
-        ).scalar() or Decimal('0')
-        
-        ytd_expense_actual = self.db.query(func.sum(Transaction.amount)).filter(
-            Transaction.type == "EXPENSE",
-            extract('year', Transaction.transaction_date) == current_year,
-            extract('month', Transaction.transaction_date) <= current_month
-        ).scalar() or Decimal('0')
-        
-        # Get category-wise YTD actuals
-        category_actuals = self.db.query(
-            Category.id,
-            Category.type,
-            func.sum(Transaction.amount).label('actual')
-        ).join(Transaction, Category.id == Transaction.category_id).filter(
-            extract('year', Transaction.transaction_date) == current_year,
-            extract('month', Transaction.transaction_date) <= current_month
-        ).group_by(Category.id, Category.type).all()
-        
-        # Add actual amounts to categories
-        actual_lookup = {cat[0]: cat[2] for cat in category_actuals}
-        
-        for category in income_categories + expense_categories:
-            cat_id = uuid.UUID(category['id'])
-            category['ytd_actual'] = float(actual_lookup.get(cat_id, Decimal('0')))
-            category['ytd_difference'] = category['ytd_budget'] - category['ytd_actual']
-        
+                ytd_expense_budget += ytd_budget
+                target = expense_categories
+            else:
+                continue
+
+            ytd_actual = float(actual_lookup.get(line_item.category_id, Decimal('0')))
+            target.append({
+                'id': str(line_item.category_id),
+                'name': line_item.category.name,
+                'yearly_budget': yearly_budget,
+                'monthly_budget': monthly_budget,
+                'ytd_budget': ytd_budget,
+                'ytd_actual': ytd_actual,
+                'ytd_difference': ytd_budget - ytd_actual
+            })
+
         return {
             'budget': active_budget,
             'current_month': current_month,
             'current_year': current_year,
-            'ytd_income_budget': float(ytd_income_budget),
+            'ytd_income_budget': ytd_income_budget,
             'ytd_income_actual': float(ytd_income_actual),
-            'ytd_expense_budget': float(ytd_expense_budget),
+            'ytd_expense_budget': ytd_expense_budget,
             'ytd_expense_actual': float(ytd_expense_actual),
             'income_categories': income_categories,
             'expense_categories': expense_categories
-        }
\ No newline at end of file
+        }